@@ -0,0 +1,142 @@
+# ann_index.py
+"""Inverted-file (IVF) approximate nearest-neighbour index for article embeddings.
+
+Offline, spherical k-means splits the unit-length embeddings into `nlist`
+clusters and the vectors are stored grouped by cluster. At query time only
+the `nprobe` clusters whose centroids are closest to the query are scanned,
+so the cost is about nprobe / nlist of brute force. Raising nprobe trades
+latency for recall; nprobe == nlist is exact.
+
+Saved as plain .npy files and memory-mapped on load, like the embeddings; the
+grouped vectors can be stored as int8 codes with per-vector scales.
+"""
+import json
+import os
+
+import numpy as np
+
+from load_data_supabase import write_json
+from quantization import dot_scores
+from search_index import top_k
+
+DEFAULT_NPROBE = int(os.getenv("INTELLIFRAUD_ANN_NPROBE", "8"))
+KMEANS_ITERATIONS = 20
+KMEANS_SAMPLE = 100_000    # vectors used to train the centroids
+ASSIGN_BLOCK = 16_384      # vectors assigned to centroids per matmul
+
+ARRAYS = ["centroids", "offsets", "ids", "vectors"]
+
+
+def default_nlist(n):
+    """~sqrt(n) clusters: balances centroid scoring against list scanning."""
+    return max(1, int(np.sqrt(n)))
+
+
+def assign(vectors, centroids):
+    """Nearest centroid (max inner product) of every vector."""
+    labels = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), ASSIGN_BLOCK):
+        block = np.asarray(vectors[start:start + ASSIGN_BLOCK], dtype=np.float32)
+        labels[start:start + len(block)] = (block @ centroids.T).argmax(axis=1)
+    return labels
+
+
+def spherical_kmeans(vectors, nlist, iterations=KMEANS_ITERATIONS, seed=0):
+    """Unit-length centroids of nlist clusters (cosine k-means)."""
+    rng = np.random.default_rng(seed)
+    sample = vectors
+    if len(vectors) > KMEANS_SAMPLE:
+        sample = vectors[np.sort(rng.choice(len(vectors), KMEANS_SAMPLE, replace=False))]
+    sample = np.asarray(sample, dtype=np.float32)
+    # Int8 codes are scaled per row; only their direction matters here.
+    sample /= np.maximum(np.linalg.norm(sample, axis=1, keepdims=True), 1e-12)
+
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+    for _ in range(iterations):
+        labels = assign(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, sample)
+
+        # Empty clusters are re-seeded from random vectors.
+        empty = np.bincount(labels, minlength=nlist) == 0
+        sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+
+        centroids = sums / np.maximum(np.linalg.norm(sums, axis=1, keepdims=True), 1e-12)
+
+    return centroids
+
+
+class IvfIndex:
+    """Embeddings grouped by k-means cluster, searched over the nearest clusters."""
+
+    def __init__(self, centroids, offsets, ids, vectors, scales=None, nprobe=DEFAULT_NPROBE):
+        self.centroids = centroids     # (nlist, dim) float32
+        self.offsets = offsets         # cluster c holds rows offsets[c]:offsets[c + 1]
+        self.ids = ids                 # row -> article index
+        self.vectors = vectors         # (n, dim) embeddings, grouped by cluster
+        self.scales = scales           # per-row scales when vectors are int8 codes
+        self.nprobe = nprobe
+
+    @classmethod
+    def build(cls, embeddings, nlist=None, seed=0, scales=None):
+        """Cluster embeddings (int8 codes when their per-row scales are given)."""
+        nlist = min(nlist or default_nlist(len(embeddings)), len(embeddings))
+        centroids = spherical_kmeans(embeddings, nlist, seed=seed)
+        labels = assign(embeddings, centroids)
+
+        order = np.argsort(labels, kind="stable")
+        offsets = np.zeros(nlist + 1, dtype=np.int64)
+        np.cumsum(np.bincount(labels, minlength=nlist), out=offsets[1:])
+
+        vectors = np.asarray(embeddings)[order]
+        if scales is not None:
+            scales = np.asarray(scales)[order]
+        return cls(centroids, offsets, order.astype(np.int32), vectors, scales)
+
+    @property
+    def nlist(self):
+        return len(self.centroids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def search_vector(self, query_vec, k=10, nprobe=None):
+        """Approximate top-k (article index, cosine) pairs for an encoded query."""
+        nprobe = min(nprobe or self.nprobe, self.nlist)
+        query_vec = np.asarray(query_vec, dtype=np.float32)
+        probes = top_k(self.centroids @ query_vec, nprobe)
+
+        rows = np.concatenate([
+            np.arange(self.offsets[c], self.offsets[c + 1]) for c in probes
+        ])
+        scales = None if self.scales is None else self.scales[rows]
+        scores = dot_scores(self.vectors[rows], query_vec, scales)
+        return [(int(self.ids[rows[i]]), float(scores[i])) for i in top_k(scores, k)]
+
+    def save(self, path, meta):
+        """Write the arrays under path; meta.json (with `meta` merged in) goes last."""
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            os.remove(meta_path)  # the old index is invalid once any array is replaced
+
+        for name in ARRAYS:
+            np.save(os.path.join(path, f"{name}.npy"), getattr(self, name))
+        if self.scales is not None:
+            np.save(os.path.join(path, "scales.npy"), self.scales)
+        write_json({**meta, "nlist": self.nlist, "int8": self.scales is not None}, meta_path)
+
+    @classmethod
+    def load(cls, path, nprobe=DEFAULT_NPROBE):
+        """(index, meta) memory-mapped from path, or (None, None) if there is none."""
+        meta_path = os.path.join(path, "meta.json")
+        if not os.path.exists(meta_path):
+            return None, None
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in ARRAYS}
+        arrays["centroids"] = np.asarray(arrays["centroids"])  # small; scored every query
+        if meta.get("int8"):
+            arrays["scales"] = np.load(os.path.join(path, "scales.npy"))
+        return cls(**arrays, nprobe=nprobe), meta
@@ -0,0 +1,165 @@
+# article_writer.py
+import json
+import os
+import time
+
+import pandas as pd
+
+DEFAULT_JSONL_PATH = "fraud_articles.jsonl"
+DEFAULT_CHECKPOINT_EVERY = 50  # articles between checkpoints
+
+ARTICLE_COLUMNS = ["title", "url", "article_date", "content", "keyword_hits"]
+JSON_COLUMNS = ["keyword_hits", "aliases"]
+
+
+class ArticleWriter:
+    """Append-only JSONL article log with periodic checkpoints.
+
+    Every `checkpoint_every` articles the file is flushed and fsync'd and its size
+    recorded in `<path>.checkpoint`; `on_checkpoint` (e.g. committing the crawl
+    state) runs right after. Reopening with resume=True truncates anything
+    written after the last checkpoint, so an interrupted crawl picks up from a
+    clean, consistent point instead of holding everything in memory.
+
+    With a `dedup` index (dedup.NearDuplicateIndex) every article is tagged with
+    the `canonical_url` of the first copy of its body; read_articles() folds the
+    duplicates into that row's `aliases`.
+    """
+
+    def __init__(self, path=DEFAULT_JSONL_PATH, checkpoint_every=DEFAULT_CHECKPOINT_EVERY,
+                 on_checkpoint=None, resume=True, dedup=None):
+        self.path = path
+        self.checkpoint_path = path + ".checkpoint"
+        self.checkpoint_every = checkpoint_every
+        self.on_checkpoint = on_checkpoint
+        self.dedup = dedup
+        self.rows = 0
+        self.pending = 0
+
+        if resume:
+            self._restore()
+            if dedup is not None:
+                for row in read_articles(path).itertuples():
+                    dedup.add(row.url, row.content if isinstance(row.content, str) else "")
+        elif os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+        self.file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        self.close()
+
+    def _restore(self):
+        if not os.path.exists(self.path):
+            return
+
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            size, self.rows = checkpoint["bytes"], checkpoint["rows"]
+        else:
+            # Log written before checkpoints existed: keep it, count its rows.
+            size = os.path.getsize(self.path)
+            with open(self.path, "rb") as f:
+                self.rows = sum(1 for _ in f)
+
+        if os.path.getsize(self.path) > size:
+            print(f"[!] Discarding rows written after the last checkpoint in {self.path}")
+            with open(self.path, "r+b") as f:
+                f.truncate(size)
+
+        print(f"[+] Resuming {self.path} from checkpoint at {self.rows} articles")
+
+    def write(self, article):
+        if self.dedup is not None:
+            canonical = self.dedup.add(article["url"], article.get("content") or "")
+            if canonical != article["url"]:
+                print(f"[=] Near-duplicate of {canonical}: {article['url']}")
+            article = {**article, "canonical_url": canonical}
+
+        self.file.write(json.dumps(article, ensure_ascii=False) + "\n")
+        self.rows += 1
+        self.pending += 1
+
+        if self.pending >= self.checkpoint_every:
+            self.checkpoint()
+
+    def checkpoint(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+        tmp = self.checkpoint_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"rows": self.rows, "bytes": self.file.tell(), "time": time.time()}, f)
+        os.replace(tmp, self.checkpoint_path)
+
+        if self.on_checkpoint:
+            self.on_checkpoint()
+        self.pending = 0
+
+    def close(self):
+        """Write a final checkpoint and close the log."""
+        if not self.file.closed:
+            self.checkpoint()
+            self.file.close()
+
+
+def read_articles(path=DEFAULT_JSONL_PATH, collapse_duplicates=True):
+    """Load the article log, keeping only the latest row for each URL.
+
+    With collapse_duplicates, near-duplicate rows are dropped and their URLs
+    listed in the `aliases` column of the canonical row.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return pd.DataFrame(columns=ARTICLE_COLUMNS)
+
+    df = pd.read_json(path, lines=True, dtype=False)
+    df = df.drop_duplicates("url", keep="last").reset_index(drop=True)
+
+    if collapse_duplicates and "canonical_url" in df.columns:
+        canonical = df["canonical_url"].fillna(df["url"])
+        # Follow chains to their root: X -> B stays valid after a recrawl makes B -> A.
+        parent = dict(zip(df["url"], canonical))
+        for _ in range(len(df)):
+            resolved = canonical.map(parent).fillna(canonical)
+            if resolved.equals(canonical):
+                break
+            canonical = resolved
+
+        is_alias = (canonical != df["url"]) & canonical.isin(df["url"])
+        aliases = df.loc[is_alias, "url"].groupby(canonical[is_alias]).agg(list)
+
+        df = df.loc[~is_alias].drop(columns="canonical_url").reset_index(drop=True)
+        df["aliases"] = [aliases.get(url, []) for url in df["url"]]
+
+    return df
+
+
+def export_csv(jsonl_path, csv_path):
+    """Write the deduplicated article log out as the CSV the rest of the project reads."""
+    df = read_articles(jsonl_path)
+
+    for col in JSON_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].apply(
+                lambda v: json.dumps(v) if isinstance(v, (dict, list)) else v
+            )
+
+    df.to_csv(csv_path, index=False, encoding="utf-8")
+    return df
+
+
+def seed_from_csv(csv_path, jsonl_path=DEFAULT_JSONL_PATH, dedup=None):
+    """Start a new article log from an existing CSV export."""
+    df = pd.read_csv(csv_path)
+
+    if dedup is not None:
+        df["canonical_url"] = [
+            dedup.add(url, content if isinstance(content, str) else "")
+            for url, content in zip(df["url"], df["content"])
+        ]
+    df.to_json(jsonl_path, orient="records", lines=True, force_ascii=False)
+    print(f"[+] Seeded {jsonl_path} with {len(df)} articles from {csv_path}")
@@ -0,0 +1,81 @@
+# articles.py
+"""The article table every page, index and offline job reads.
+
+Plain pandas / Arrow code with no Streamlit dependency, so CLIs and
+benchmarks can normalize the corpus without the app's shared service
+(dataset.py).
+"""
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from keyword_table import KeywordTable
+from load_data_supabase import KEYWORD_TYPE, KEYWORD_DTYPE
+
+TEXT_COLUMNS = ["title", "summary", "url"]
+
+# Arrow-backed strings: one contiguous buffer per column instead of a PyObject per cell.
+STRING_DTYPE = pd.StringDtype("pyarrow")
+
+
+def normalize_articles(df):
+    """Bring the raw article table into the one schema every page reads.
+
+    title / summary / url  -> str ("Untitled Article" for missing titles)
+    keywords               -> Arrow list of lowercase keyword strings
+    keywords_text          -> the same keywords joined with ", " for display
+    timestamp              -> datetime64 (NaT when unparseable)
+    search_text            -> lowercase title + summary + keywords, for search
+    """
+    df = df.rename(columns=str.lower)
+
+    for col in TEXT_COLUMNS:
+        if col not in df.columns:
+            df[col] = ""
+    df["title"] = df["title"].fillna("Untitled Article").astype(str)
+    df["summary"] = df["summary"].fillna("").astype(str)
+    df["url"] = df["url"].fillna("").astype(str)
+
+    if "keywords" not in df.columns:
+        df["keywords"] = [[] for _ in range(len(df))]
+    keywords = keyword_array(df["keywords"])
+    df["keywords"] = pd.Series(pd.arrays.ArrowExtensionArray(keywords), index=df.index)
+    df["keywords_text"] = pd.Series(
+        pc.binary_join(keywords, ", ").to_pandas(types_mapper=pd.ArrowDtype), index=df.index
+    )
+
+    df["timestamp"] = pd.to_datetime(df.get("timestamp"), errors="coerce")
+
+    df["search_text"] = (
+        df["title"] + " " + df["summary"] + " " + df["keywords_text"]
+    ).str.lower()
+
+    for col in TEXT_COLUMNS + ["keywords_text", "search_text"]:
+        df[col] = df[col].astype(STRING_DTYPE)
+
+    return df.reset_index(drop=True)
+
+
+def keyword_array(keywords):
+    """The keywords column as one Arrow list array (no nulls)."""
+    if keywords.dtype == KEYWORD_DTYPE:
+        arr = pa.array(keywords.array)
+        if isinstance(arr, pa.ChunkedArray):
+            arr = arr.combine_chunks()
+    else:
+        # Lists built in Python (e.g. by callers that bypass the loader).
+        arr = pa.array(
+            [list(x) if isinstance(x, (list, tuple)) else [] for x in keywords], type=KEYWORD_TYPE
+        )
+    return arr.fill_null(pa.scalar([], type=KEYWORD_TYPE))
+
+
+def compact_articles(df):
+    """Split a normalized table into (articles, KeywordTable).
+
+    The keyword lists move out of the DataFrame into the CSR KeywordTable;
+    keywords_text stays on the table for display and text search.
+    """
+    df = df.copy(deep=False)
+    keywords = KeywordTable.from_arrow(keyword_array(df.pop("keywords")))
+    return df, keywords
@@ -0,0 +1,76 @@
+"""IVF recall@10 and latency against brute-force embedding search.
+
+Usage (from the repo root):
+    python -m benchmarks.ann_benchmark [--embeddings PATH] [--articles N] [--nlist C]
+
+PATH is an embeddings .npy written by embed_articles.py. Without it, N
+unit-length vectors are drawn around random topic centres, which clusters
+them roughly the way sentence embeddings of news articles cluster. Queries
+are perturbed copies of held-out vectors.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ann_index import IvfIndex
+from search_index import top_k
+
+K = 10
+
+
+def unit(x):
+    return (x / np.linalg.norm(x, axis=1, keepdims=True)).astype(np.float32)
+
+
+def synthetic_embeddings(n, dim=384, topics=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    centres = unit(rng.standard_normal((topics, dim)))
+    topic = rng.integers(0, topics, n)
+    return unit(centres[topic] + 0.08 * rng.standard_normal((n, dim)))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--embeddings", help="embeddings .npy from embed_articles.py")
+    ap.add_argument("--articles", type=int, default=200_000)
+    ap.add_argument("--nlist", type=int, default=None)
+    ap.add_argument("--queries", type=int, default=200)
+    args = ap.parse_args()
+
+    if args.embeddings:
+        vectors = np.load(args.embeddings).astype(np.float32)
+    else:
+        vectors = synthetic_embeddings(args.articles)
+    rng = np.random.default_rng(1)
+    queries = unit(vectors[rng.choice(len(vectors), args.queries)]
+                   + 0.05 * rng.standard_normal((args.queries, vectors.shape[1])))
+
+    base = vectors.astype(np.float16)   # what embed_articles.py stores
+    start = time.perf_counter()
+    ivf = IvfIndex.build(base, args.nlist)
+    print(f"{len(base)} vectors, {ivf.nlist} clusters, built in {time.perf_counter() - start:.1f}s\n")
+
+    truth, t_brute = [], 0.0
+    for q in queries:
+        start = time.perf_counter()
+        scores = base.astype(np.float32) @ q
+        truth.append(set(top_k(scores, K).tolist()))
+        t_brute += time.perf_counter() - start
+    print(f"{'brute force':>12s} {'':>10s} {t_brute / len(queries) * 1e3:8.2f} ms")
+
+    print(f"{'nprobe':>12s} {'recall@10':>10s} {'latency':>11s}")
+    nprobe = 1
+    while nprobe <= ivf.nlist:
+        found, elapsed = 0, 0.0
+        for q, expected in zip(queries, truth):
+            start = time.perf_counter()
+            hits = ivf.search_vector(q, K, nprobe)
+            elapsed += time.perf_counter() - start
+            found += len(expected & {doc for doc, _ in hits})
+        print(f"{nprobe:12d} {found / (K * len(queries)):10.3f} {elapsed / len(queries) * 1e3:8.2f} ms")
+        nprobe *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Synthetic article corpora shaped like the published fraud_analysis_final.csv."""
+import numpy as np
+import pandas as pd
+
+WORDS = (
+    "investor fraud scheme broker account securities firm customer funds market "
+    "trading risk alert regulator finra report elderly wire transfer crypto asset "
+    "identity theft phishing scam loss recovery complaint disclosure advisor "
+    "portfolio manipulation pump dump ponzi offering unregistered sanction fine"
+).split()
+
+
+def synthesize_corpus(n, vocabulary=2000, seed=0):
+    """n raw article rows: title, url, summary, keywords (comma string), timestamp."""
+    rng = np.random.default_rng(seed)
+    words = np.array(WORDS, dtype=object)
+
+    # Keyword phrases of 1-3 words; popularity is Zipf-like, as in the real corpus.
+    phrases = sorted({" ".join(rng.choice(words, rng.integers(1, 4))) for _ in range(vocabulary * 2)})
+    phrases = np.array(phrases[:vocabulary], dtype=object)
+    weights = 1.0 / np.arange(1, len(phrases) + 1)
+    weights /= weights.sum()
+
+    def sentence(lo, hi):
+        return " ".join(rng.choice(words, rng.integers(lo, hi))).capitalize() + "."
+
+    titles = [sentence(5, 12) for _ in range(n)]
+    summaries = [" ".join(sentence(12, 30) for _ in range(3)) for _ in range(n)]
+    keywords = [
+        ", ".join(rng.choice(phrases, rng.integers(2, 9), p=weights, replace=False))
+        for _ in range(n)
+    ]
+    timestamps = pd.Timestamp("2023-01-01") + pd.to_timedelta(rng.integers(0, 3 * 365, n), unit="D")
+
+    return pd.DataFrame({
+        "title": pd.Series(titles, dtype=object),
+        "url": pd.Series([f"https://www.finra.org/media-center/article-{i}" for i in range(n)], dtype=object),
+        "summary": pd.Series(summaries, dtype=object),
+        "keywords": pd.Series(keywords, dtype=object),
+        "timestamp": timestamps.strftime("%Y-%m-%d %H:%M").astype(object),
+    })
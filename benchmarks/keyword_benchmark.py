@@ -0,0 +1,57 @@
+"""Keyword parsing: per-cell apply / eval vs the vectorized loader stage.
+
+Usage (from the repo root):
+    python -m benchmarks.keyword_benchmark [--articles N]
+
+"apply" is the old clean_fraud_data split; "eval" is the old Fraud Trends
+path that re-parsed stringified lists cell by cell.
+"""
+import argparse
+import time
+
+from benchmarks.corpus import synthesize_corpus
+from load_data_supabase import normalize_keywords
+
+
+def parse_apply(values):
+    return values.astype(str).fillna("").apply(
+        lambda x: [k.strip().lower() for k in x.split(",") if k.strip()]
+    )
+
+
+def parse_eval(values):
+    def parse(val):
+        try:
+            return eval(val)
+        except Exception:
+            return []
+    return values.map(parse)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--articles", type=int, default=100_000)
+    args = ap.parse_args()
+
+    raw = synthesize_corpus(args.articles)["keywords"]
+
+    applied, t_apply = timed(parse_apply, raw)
+    # What Fraud Trends saw: lists written to CSV and read back as their repr.
+    evaluated, t_eval = timed(parse_eval, applied.map(repr))
+    vectorized, t_vec = timed(normalize_keywords, raw)
+
+    assert vectorized.to_pylist() == applied.tolist() == evaluated.tolist()
+
+    print(f"{len(raw)} articles, {len(vectorized.flatten())} keywords")
+    for label, elapsed in [("apply", t_apply), ("eval", t_eval), ("vectorized", t_vec)]:
+        print(f"{label:12s} {elapsed * 1e3:9.1f} ms   {t_apply / elapsed:5.1f}x vs apply")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Memory of the article table: Python objects vs Arrow strings + CSR keywords.
+
+Usage (from the repo root):
+    python -m benchmarks.memory_report [--articles N]
+
+The "object" layout is the table as pages used to hold it: object-dtype text
+columns and one Python list of str per article. The "compact" layout is what
+dataset.py serves now: Arrow-backed strings and a KeywordTable.
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from articles import compact_articles, normalize_articles
+from benchmarks.corpus import synthesize_corpus
+from load_data_supabase import clean_fraud_data
+
+
+def python_bytes(values, seen):
+    """sys.getsizeof of every object reachable from values (lists one level deep)."""
+    total = 0
+    for value in values:
+        for obj in ([value, *value] if isinstance(value, list) else [value]):
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                total += sys.getsizeof(obj)
+    return total
+
+
+def column_bytes(series):
+    if series.dtype == object:
+        return series.memory_usage(index=False, deep=False) + python_bytes(series, set())
+    return series.memory_usage(index=False, deep=True)
+
+
+def object_layout(df):
+    df = normalize_articles(df)
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.StringDtype):
+            df[col] = df[col].astype(object)
+    df["keywords"] = pd.Series(df["keywords"].tolist(), index=df.index, dtype=object)
+    return df
+
+
+def category_scores_rows(df, category):
+    return [
+        sum(1 for a in row["keywords"] for c in category if c in a or a in c)
+        for _, row in df.iterrows()
+    ]
+
+
+def category_scores_csr(keywords, category):
+    per_keyword = [sum(1 for c in category if c in kw or kw in c) for kw in keywords.vocabulary]
+    return keywords.row_sums(per_keyword)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--articles", type=int, default=100_000)
+    args = ap.parse_args()
+
+    raw = clean_fraud_data(synthesize_corpus(args.articles))
+
+    legacy = object_layout(raw)
+    articles, keywords = compact_articles(normalize_articles(raw))
+
+    print(f"{len(legacy)} articles, {len(keywords.vocabulary)} distinct keywords\n")
+    print(f"{'column':16s} {'object MB':>10s} {'compact MB':>11s}")
+    total_old = total_new = 0
+    for col in legacy.columns:
+        old = column_bytes(legacy[col])
+        new = keywords.nbytes if col == "keywords" else column_bytes(articles[col])
+        total_old += old
+        total_new += new
+        print(f"{col:16s} {old / 1e6:10.1f} {new / 1e6:11.1f}")
+    print(f"{'total':16s} {total_old / 1e6:10.1f} {total_new / 1e6:11.1f}"
+          f"   ({total_old / total_new:.1f}x smaller)\n")
+
+    category = ["investment fraud", "ponzi", "identity theft"]
+    start = time.perf_counter()
+    rows = category_scores_rows(legacy, category)
+    t_rows = time.perf_counter() - start
+    start = time.perf_counter()
+    csr = category_scores_csr(keywords, category)
+    t_csr = time.perf_counter() - start
+    assert np.array_equal(np.asarray(rows, dtype=np.float64), csr)
+    print(f"category scoring: iterrows {t_rows * 1e3:8.1f} ms   CSR {t_csr * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Article parsing throughput: pages parsed per second.
+
+Usage (from the repo root):
+    python -m benchmarks.parse_benchmark [--fixtures DIR] [--workers N]
+
+DIR holds saved article pages (*.html). Without it, FINRA-style pages are
+rebuilt from the rows of fraud_articles.csv.
+"""
+import argparse
+import contextlib
+import glob
+import html
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from intellifraud_scraper import parse_article
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>{title}</title></head>
+<body>
+<nav>{nav}</nav>
+<main>
+<h1>{title}</h1>
+<time datetime="{date}">{date}</time>
+{paragraphs}
+</main>
+<footer>{nav}</footer>
+</body></html>
+"""
+
+
+def load_fixtures(path):
+    pages = []
+    for file in sorted(glob.glob(os.path.join(path, "*.html"))):
+        with open(file, encoding="utf-8") as f:
+            pages.append((f.read(), file))
+    return pages
+
+
+def synthesize_fixtures(csv_path="fraud_articles.csv"):
+    """Rebuild article-like HTML from the scraped CSV so the benchmark runs offline."""
+    df = pd.read_csv(csv_path).fillna("")
+    nav = "".join(f'<a href="/media-center/item-{i}">Link {i}</a>' for i in range(200))
+    pages = []
+
+    for _, row in df.iterrows():
+        paragraphs = "\n".join(
+            f"<p>{html.escape(line)}</p>" for line in str(row["content"]).split("\n")
+        )
+        page = PAGE_TEMPLATE.format(
+            title=html.escape(str(row["title"])),
+            date=row["article_date"],
+            nav=nav,
+            paragraphs=paragraphs,
+        )
+        pages.append((page, row["url"]))
+
+    return pages
+
+
+def run_serial(pages, parser):
+    for page, url in pages:
+        parse_article(page, url, parser)
+
+
+def run_pool(pages, parser, workers):
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        htmls, urls = zip(*pages)
+        list(pool.map(parse_article, htmls, urls, [parser] * len(pages), chunksize=8))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--fixtures", help="directory of saved *.html article pages")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--repeat", type=int, default=20, help="times to repeat the fixture set")
+    args = ap.parse_args()
+
+    pages = load_fixtures(args.fixtures) if args.fixtures else synthesize_fixtures()
+    pages = pages * args.repeat
+    print(f"{len(pages)} pages, {sum(len(p) for p, _ in pages) / 1e6:.1f} MB of HTML")
+
+    parsers = ["html.parser"]
+    with contextlib.suppress(ImportError):
+        import lxml  # noqa: F401
+        parsers.append("lxml")
+
+    for parser in parsers:
+        for label, run in [
+            ("serial", lambda: run_serial(pages, parser)),
+            (f"pool x{args.workers}", lambda: run_pool(pages, parser, args.workers)),
+        ]:
+            # parse_article reports skipped pages; keep the timing output readable
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - start
+            print(f"{parser:12s} {label:10s} {len(pages) / elapsed:8.1f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Memory and ranking quality of int8 / float16 embeddings versus float32.
+
+Usage (from the repo root):
+    python -m benchmarks.quantization_report [--csv fraud_analysis_final.csv]
+    python -m benchmarks.quantization_report --synthetic 100000
+
+Embeds the corpus with the app's sentence-transformer model (or, with
+--synthetic N, draws N clustered unit vectors), uses every article's title as
+a query, and compares each compressed store's ranking with float32's.
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+from scipy.stats import kendalltau
+
+from articles import normalize_articles
+from benchmarks.ann_benchmark import synthetic_embeddings, unit
+from embedding_index import DEFAULT_MODEL, embedding_text, get_model
+from quantization import dot_scores, quantize_int8
+from search_index import top_k
+
+K = 10
+MAX_QUERIES = 500
+
+
+def stores(vectors):
+    """{name: (matrix, scales)} for each storage format."""
+    codes, scales = quantize_int8(vectors)
+    return {
+        "float32": (vectors, None),
+        "float16": (vectors.astype(np.float16), None),
+        "int8": (codes, scales),
+    }
+
+
+def compare(reference, scores, k):
+    truth, found = top_k(reference, k), top_k(scores, k)
+    return {
+        "recall": len(set(truth) & set(found)) / len(truth),
+        "top1": float(truth[0] == found[0]),
+        "tau": kendalltau(reference[truth], scores[truth]).statistic if len(truth) > 1 else 1.0,
+        "error": float(np.abs(reference - scores).max()),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--csv", default="fraud_analysis_final.csv")
+    ap.add_argument("--model", default=DEFAULT_MODEL)
+    ap.add_argument("--synthetic", type=int, metavar="N", help="use N synthetic vectors instead")
+    args = ap.parse_args()
+
+    if args.synthetic:
+        vectors = synthetic_embeddings(args.synthetic)
+        rng = np.random.default_rng(1)
+        picks = rng.choice(len(vectors), min(MAX_QUERIES, len(vectors)), replace=False)
+        queries = unit(vectors[picks] + 0.05 * rng.standard_normal((len(picks), vectors.shape[1])))
+        source = f"{len(vectors)} synthetic vectors"
+    else:
+        df = normalize_articles(pd.read_csv(args.csv))
+        model = get_model(args.model)
+        vectors = model.encode(embedding_text(df), normalize_embeddings=True, convert_to_numpy=True)
+        queries = model.encode(df["title"].tolist()[:MAX_QUERIES], normalize_embeddings=True,
+                               convert_to_numpy=True)
+        source = f"{len(vectors)} articles of {args.csv} ({args.model})"
+
+    vectors = vectors.astype(np.float32)
+    k = min(K, len(vectors))
+    print(f"{source}, {vectors.shape[1]}-d, {len(queries)} queries, recall@{k}\n")
+    print(f"{'store':8s} {'bytes/doc':>10s} {'MB/100k':>8s} {'recall':>7s} {'top-1':>6s} "
+          f"{'tau':>6s} {'max err':>8s}")
+
+    for name, (matrix, scales) in stores(vectors).items():
+        per_doc = matrix.itemsize * matrix.shape[1] + (0 if scales is None else scales.itemsize)
+        results = [
+            compare(vectors @ q, dot_scores(matrix, q, scales), k) for q in queries
+        ]
+        mean = {key: np.mean([r[key] for r in results]) for key in results[0]}
+        print(f"{name:8s} {per_doc:10d} {per_doc * 1e5 / 1e6:8.1f} {mean['recall']:7.3f} "
+              f"{mean['top1']:6.3f} {mean['tau']:6.3f} {max(r['error'] for r in results):8.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Related articles: per-hit keyword string parsing vs the sparse incidence matrix.
+
+Usage (from the repo root):
+    python -m benchmarks.related_benchmark [--articles N] [--queries Q] [--hits K]
+
+Each query takes a random article as the best match and K random articles as
+the hits after it, then picks the (up to 3) hits sharing at least 2 keyword
+words with it, as the home page does.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from articles import compact_articles, normalize_articles
+from benchmarks.corpus import synthesize_corpus
+from keyword_overlap import KeywordOverlapIndex
+from load_data_supabase import clean_fraud_data
+
+
+def related_strings(df, base, others, min_shared=2, limit=3):
+    """The old home.py loop over keywords_text."""
+    base_kw = set(df.iloc[base]["keywords_text"].replace(",", "").split())
+    related = []
+    for idx in others:
+        overlap = base_kw & set(df.iloc[idx]["keywords_text"].replace(",", "").split())
+        if len(overlap) >= min_shared:
+            related.append((int(idx), sorted(overlap)))
+            if len(related) == limit:
+                break
+    return related
+
+
+def related_sparse(index, base, others, min_shared=2, limit=3):
+    chosen = index.related(base, others, min_shared, limit)
+    return [(int(others[i]), sorted(index.shared(base, others[i]))) for i in chosen]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--articles", type=int, default=100_000)
+    ap.add_argument("--queries", type=int, default=500)
+    ap.add_argument("--hits", type=int, default=19)
+    args = ap.parse_args()
+
+    df, keywords = compact_articles(normalize_articles(clean_fraud_data(synthesize_corpus(args.articles))))
+
+    start = time.perf_counter()
+    index = KeywordOverlapIndex.from_keywords(keywords)
+    t_build = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    queries = [(int(rng.integers(len(df))), rng.choice(len(df), args.hits, replace=False))
+               for _ in range(args.queries)]
+
+    start = time.perf_counter()
+    expected = [related_strings(df, base, others) for base, others in queries]
+    t_strings = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [related_sparse(index, base, others) for base, others in queries]
+    t_sparse = time.perf_counter() - start
+
+    assert actual == expected
+
+    print(f"{len(df)} articles, {index.matrix.shape[1]} keyword words, {index.matrix.nnz} entries; "
+          f"incidence matrix built in {t_build * 1e3:.1f} ms")
+    for label, elapsed in [("strings", t_strings), ("sparse", t_sparse)]:
+        print(f"{label:8s} {elapsed / args.queries * 1e3:8.3f} ms/query   {t_strings / elapsed:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
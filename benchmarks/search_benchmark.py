@@ -0,0 +1,91 @@
+"""Query latency: full cosine + argsort vs TF-IDF top-k vs BM25 with MaxScore.
+
+Usage (from the repo root):
+    python -m benchmarks.search_benchmark [--sizes 1000 10000 100000 1000000]
+
+Corpora are synthetic document-term matrices (Zipf-distributed terms, ~60
+tokens per document) so the largest sizes build in seconds.
+"""
+import argparse
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfTransformer, TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from bm25_index import Bm25Index
+from search_index import TfidfIndex
+
+VOCABULARY = 20_000
+DOC_LENGTH = 60
+
+
+def synthetic_counts(n, seed=0):
+    """Document-term count matrix; term t is the token "t<t>"."""
+    rng = np.random.default_rng(seed)
+    lengths = rng.poisson(DOC_LENGTH, n)
+    terms = (rng.zipf(1.2, lengths.sum()) - 1) % VOCABULARY
+    rows = np.repeat(np.arange(n), lengths)
+    counts = sp.csr_matrix((np.ones(len(terms)), (rows, terms)), shape=(n, VOCABULARY))
+    counts.sum_duplicates()
+    return counts
+
+
+def synthetic_index(counts):
+    transformer = TfidfTransformer().fit(counts)
+    vectorizer = TfidfVectorizer()
+    vectorizer.vocabulary_ = {f"t{i}": i for i in range(VOCABULARY)}
+    vectorizer.idf_ = transformer.idf_
+    return TfidfIndex(vectorizer, transformer.transform(counts).tocsr())
+
+
+def search_argsort(index, query, k):
+    """What home.py used to do."""
+    scores = cosine_similarity(index.vectorizer.transform([query]), index.matrix).flatten()
+    return scores.argsort()[::-1][:k]
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    ap.add_argument("--k", type=int, default=20)
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    queries = ["t3 t40 t700", "t12 t5000", "t1 t2 t9 t150 t2000"]
+    print(f"{'docs':>9s} {'argsort ms':>11s} {'search ms':>10s} {'speedup':>8s} {'bm25 ms':>8s}")
+
+    for n in args.sizes:
+        counts = synthetic_counts(n)
+        index = synthetic_index(counts)
+        bm25 = Bm25Index(str.split, index.vectorizer.vocabulary_, counts)
+
+        for q in queries:  # pruned and exhaustive paths must agree on the top-k scores
+            old = search_argsort(index, q, args.k)
+            new = [i for i, _ in index.search(q, args.k)]
+            scores = index.scores(q)
+            assert np.allclose(scores[old], scores[new])
+
+            exhaustive = np.sort(bm25.scores(q))[::-1][:args.k]
+            exhaustive = exhaustive[exhaustive > 0]  # search only returns matching docs
+            assert np.allclose([s for _, s in bm25.search(q, args.k)], exhaustive, rtol=1e-5)
+
+        def per_query(search):
+            return timed(lambda: [search(q, args.k) for q in queries], args.repeat) / len(queries)
+
+        t_old = per_query(lambda q, k: search_argsort(index, q, k))
+        t_new = per_query(index.search)
+        t_bm25 = per_query(bm25.search)
+        print(f"{n:9d} {t_old * 1e3:11.2f} {t_new * 1e3:10.2f} {t_old / t_new:7.1f}x {t_bm25 * 1e3:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# bm25_index.py
+"""BM25 over an inverted index, with MaxScore pruning.
+
+Each term's posting list holds the ids of the documents containing it,
+sorted, next to the precomputed BM25 contribution ("impact") of the term to
+each of them. A query only touches the posting lists of its own terms:
+
+1. Terms are visited from the highest possible contribution down. Their
+   postings are accumulated in full while a document that none of them
+   contain could still reach the current top-k.
+2. Once the remaining terms' summed upper bounds cannot lift an unseen
+   document above the k-th best score, those terms are only probed (binary
+   search) for the candidates still able to make the cut.
+
+Long posting lists of common words are therefore never scanned once the
+rarer query terms have settled the top k.
+"""
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import CountVectorizer
+
+from search_index import top_k
+
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+
+class Bm25Index:
+    """Inverted index of BM25 impacts, one posting list per vocabulary term."""
+
+    def __init__(self, analyzer, vocabulary, counts, k1=DEFAULT_K1, b=DEFAULT_B):
+        self.analyzer = analyzer          # text -> tokens, same as the TF-IDF index
+        self.vocabulary = vocabulary      # token -> term id
+        self.k1 = k1
+        self.b = b
+
+        counts = sp.csr_matrix(counts, dtype=np.float32)
+        self.num_docs = counts.shape[0]
+        lengths = np.asarray(counts.sum(axis=1)).ravel()
+        avg_length = lengths.mean() if self.num_docs else 0.0
+
+        postings = counts.tocsc()
+        postings.sort_indices()
+        self.indptr = postings.indptr                 # term id -> slice of docs / impacts
+        self.docs = postings.indices                  # document ids, sorted per term
+
+        doc_freq = np.diff(self.indptr)
+        self.idf = np.log1p((self.num_docs - doc_freq + 0.5) / (doc_freq + 0.5)).astype(np.float32)
+
+        tf = postings.data
+        norm = self.k1 * (1 - self.b + self.b * lengths[self.docs] / max(avg_length, 1e-9))
+        terms = np.repeat(np.arange(len(doc_freq)), doc_freq)
+        self.impacts = (self.idf[terms] * tf * (self.k1 + 1) / (tf + norm)).astype(np.float32)
+
+        # Upper bound of each term's contribution to any single document.
+        self.max_impact = np.zeros(len(doc_freq), dtype=np.float32)
+        np.maximum.at(self.max_impact, terms, self.impacts)
+
+    @classmethod
+    def from_tfidf(cls, tfidf, texts, **params):
+        """Build over texts with the tokenizer and vocabulary of a TfidfIndex."""
+        analyzer = tfidf.vectorizer.build_analyzer()
+        vocabulary = tfidf.vectorizer.vocabulary_
+        counts = CountVectorizer(analyzer=analyzer, vocabulary=vocabulary).transform(texts)
+        return cls(analyzer, vocabulary, counts, **params)
+
+    def __len__(self):
+        return self.num_docs
+
+    def query_terms(self, query):
+        ids = {self.vocabulary.get(token) for token in self.analyzer(query)}
+        ids.discard(None)
+        return sorted(ids)
+
+    def postings(self, term):
+        start, end = self.indptr[term], self.indptr[term + 1]
+        return self.docs[start:end], self.impacts[start:end]
+
+    def scores(self, query):
+        """Exhaustive BM25 score of every document (for checks and benchmarks)."""
+        scores = np.zeros(self.num_docs, dtype=np.float32)
+        for term in self.query_terms(query):
+            docs, impacts = self.postings(term)
+            scores[docs] += impacts
+        return scores
+
+    def search(self, query, k=10):
+        """The k best documents for query as ranked (index, score) pairs."""
+        terms = sorted(self.query_terms(query), key=lambda t: -self.max_impact[t])
+        if not terms or k <= 0:
+            return []
+
+        # bound[i]: the most terms[i:] can add to any one document.
+        bound = np.append(np.cumsum(self.max_impact[terms][::-1])[::-1], 0.0)
+
+        # Phase 1: accumulate whole posting lists while an unseen doc could still win.
+        docs = np.empty(0, dtype=self.docs.dtype)
+        acc = np.empty(0, dtype=np.float32)
+        threshold = 0.0
+        i = 0
+        while i < len(terms):
+            term_docs, term_impacts = self.postings(terms[i])
+            docs, inverse = np.unique(np.concatenate([docs, term_docs]), return_inverse=True)
+            acc = np.bincount(inverse, weights=np.concatenate([acc, term_impacts]), minlength=len(docs))
+            threshold = kth_score(acc, k)
+            i += 1
+            if bound[i] <= threshold:
+                break
+
+        # Phase 2: probe the remaining terms only for docs that can still make the top k.
+        for i in range(i, len(terms)):
+            live = acc + bound[i] >= threshold
+            docs, acc = docs[live], acc[live]
+
+            term_docs, term_impacts = self.postings(terms[i])
+            pos = np.searchsorted(term_docs, docs)
+            hit = pos < len(term_docs)
+            hit[hit] = term_docs[pos[hit]] == docs[hit]
+            acc[hit] += term_impacts[pos[hit]]
+            threshold = kth_score(acc, k)
+
+        return [(int(docs[j]), float(acc[j])) for j in top_k(acc, k)]
+
+
+def kth_score(scores, k):
+    """The k-th highest score, or 0 while there are fewer than k."""
+    if len(scores) < k:
+        return 0.0
+    return float(np.partition(scores, len(scores) - k)[len(scores) - k])
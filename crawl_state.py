@@ -0,0 +1,99 @@
+# crawl_state.py
+import hashlib
+import sqlite3
+import time
+
+DEFAULT_STATE_PATH = "crawl_state.db"
+
+
+def content_hash(text):
+    """Stable fingerprint of a page body."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class CrawlState:
+    """Persistent seen-URL index: HTTP validators + content hash for every page fetched."""
+
+    def __init__(self, path=DEFAULT_STATE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url           TEXT PRIMARY KEY,
+                etag          TEXT,
+                last_modified TEXT,
+                content_hash  TEXT,
+                fetched_at    REAL
+            )
+            """
+        )
+        self.conn.commit()
+
+    def __contains__(self, url):
+        return self.get(url) is not None
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.commit()
+        self.close()
+
+    def get(self, url):
+        """Return the stored row for url as a dict, or None if never fetched."""
+        row = self.conn.execute(
+            "SELECT etag, last_modified, content_hash, fetched_at FROM pages WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(["etag", "last_modified", "content_hash", "fetched_at"], row))
+
+    def conditional_headers(self, url):
+        """If-None-Match / If-Modified-Since headers for a conditional GET of url."""
+        row = self.get(url)
+        headers = {}
+        if row:
+            if row["etag"]:
+                headers["If-None-Match"] = row["etag"]
+            if row["last_modified"]:
+                headers["If-Modified-Since"] = row["last_modified"]
+        return headers
+
+    def has_changed(self, url, content_hash):
+        """True if url is new or its body no longer matches the stored hash."""
+        previous = self.get(url)
+        return previous is None or previous["content_hash"] != content_hash
+
+    def record(self, url, etag=None, last_modified=None, content_hash=None):
+        """Store a fresh fetch of url. Returns True if the content differs from last time."""
+        changed = self.has_changed(url, content_hash)
+        self.conn.execute(
+            """
+            INSERT INTO pages (url, etag, last_modified, content_hash, fetched_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                content_hash = excluded.content_hash,
+                fetched_at = excluded.fetched_at
+            """,
+            (url, etag, last_modified, content_hash, time.time()),
+        )
+        return changed
+
+    def touch(self, url):
+        """Mark url as re-validated (e.g. after a 304) without changing its validators."""
+        self.conn.execute("UPDATE pages SET fetched_at = ? WHERE url = ?", (time.time(), url))
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        """Close the database; anything not yet committed is discarded."""
+        self.conn.close()
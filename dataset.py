@@ -0,0 +1,137 @@
+# dataset.py
+import itertools
+import os
+import threading
+
+import streamlit as st
+
+from articles import compact_articles, normalize_articles
+from bm25_index import Bm25Index
+from embedding_index import load_embeddings
+from hybrid_search import HybridIndex
+from keyword_overlap import KeywordOverlapIndex
+from load_data_supabase import load_fraud_data, corpus_version
+from search_index import build_tfidf
+
+# Seconds between checks of the storage backend for a new corpus version.
+REFRESH_INTERVAL = float(os.getenv("INTELLIFRAUD_REFRESH_SECONDS", "300"))
+
+# Numbers snapshots in build order; caches key on it so a refresh invalidates them.
+_generations = itertools.count(1)
+
+# Indexes built for every snapshot before it goes live: name -> builder(snapshot).
+# Built in order, so a builder may use the indexes listed before it.
+INDEX_BUILDERS = {
+    "tfidf": lambda snapshot: build_tfidf(snapshot.articles),
+    "bm25": lambda snapshot: Bm25Index.from_tfidf(snapshot.index("tfidf"), snapshot.articles["search_text"]),
+    # None until embed_articles.py has been run for this corpus.
+    "embeddings": lambda snapshot: load_embeddings(snapshot.articles),
+    "hybrid": lambda snapshot: (
+        HybridIndex(snapshot.index("bm25"), snapshot.index("embeddings"))
+        if snapshot.index("embeddings") is not None else None
+    ),
+    "keyword_overlap": lambda snapshot: KeywordOverlapIndex.from_keywords(snapshot.keywords),
+}
+
+
+class CorpusSnapshot:
+    """One immutable version of the corpus together with the indexes built from it."""
+
+    def __init__(self, articles, keywords, version, indexes=None):
+        self.articles = articles      # normalized DataFrame, without the keyword lists
+        self.keywords = keywords      # KeywordTable aligned with articles' rows
+        self.version = version
+        self.indexes = indexes or {}
+        self.generation = next(_generations)
+
+    def index(self, name):
+        return self.indexes[name]
+
+    def articles_view(self):
+        """The article table for one script run.
+
+        A shallow copy: it shares column data with the process-wide table, so it
+        costs no memory, and adding or replacing columns on it never leaks into
+        other pages or sessions.
+        """
+        return self.articles.copy(deep=False)
+
+
+class DatasetService:
+    """Owns the live CorpusSnapshot and refreshes it in a background thread.
+
+    The refresher polls the storage backend's corpus version every `interval`
+    seconds. When it changes, the new DataFrame and every index in
+    INDEX_BUILDERS are built on the refresher thread and only then swapped in
+    with a single reference assignment, so a request either sees the old
+    snapshot or the complete new one and never waits for a rebuild.
+    """
+
+    def __init__(self, interval=REFRESH_INTERVAL, loader=load_fraud_data, version=corpus_version):
+        self.interval = interval
+        self.loader = loader
+        self.version = version
+        self._stop = threading.Event()
+
+        self._snapshot = self._build(self._poll_version())
+
+        self._thread = None
+        if interval > 0:
+            self._thread = threading.Thread(
+                target=self._run, name="corpus-refresher", daemon=True
+            )
+            self._thread.start()
+
+    def current(self):
+        return self._snapshot
+
+    def _poll_version(self):
+        try:
+            return self.version()
+        except Exception as e:
+            print(f"[!] Could not check corpus version: {e}")
+            return None
+
+    def _build(self, version):
+        articles, keywords = compact_articles(normalize_articles(self.loader()))
+        snapshot = CorpusSnapshot(articles, keywords, version)
+        for name, build in INDEX_BUILDERS.items():
+            snapshot.indexes[name] = build(snapshot)
+        return snapshot
+
+    def refresh(self, force=False):
+        """Rebuild and swap in a new snapshot if the corpus version changed."""
+        version = self._poll_version()
+        if not force and (version is None or version == self._snapshot.version):
+            return False
+
+        snapshot = self._build(version)
+        self._snapshot = snapshot  # atomic swap
+        print(f"[✓] Corpus refreshed to version {version} ({len(snapshot.articles)} articles)")
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                # Keep serving the current snapshot; try again next interval.
+                print(f"[!] Corpus refresh failed: {e}")
+
+    def stop(self):
+        """End the refresher thread; the current snapshot stays readable."""
+        self._stop.set()
+
+
+# on_release stops the refresher when the entry is cleared (e.g. "Clear cache"),
+# so the replacement service does not leave the old thread polling and rebuilding.
+@st.cache_resource(show_spinner="Loading articles…", on_release=DatasetService.stop)
+def get_service():
+    # cache_resource (unlike cache_data) hands every session the same object
+    # instead of a pickled copy, so the corpus is held once per process.
+    return DatasetService()
+
+
+def get_snapshot():
+    """The live corpus snapshot. Grab it once per script run for a consistent view."""
+    return get_service().current()
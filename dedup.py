@@ -0,0 +1,126 @@
+# dedup.py
+import re
+import zlib
+
+import numpy as np
+
+DEFAULT_THRESHOLD = 0.8   # estimated Jaccard similarity that counts as a duplicate
+DEFAULT_NUM_PERM = 128    # MinHash signature length
+DEFAULT_BANDS = 32        # LSH bands (rows per band = num_perm / bands)
+DEFAULT_SHINGLE_SIZE = 5  # words per shingle
+DEFAULT_MIN_SHINGLES = 3  # shorter bodies are never matched (too little text to compare)
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def shingle_hashes(text, size=DEFAULT_SHINGLE_SIZE):
+    """32-bit hashes of the overlapping word n-grams of text."""
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) <= size:
+        shingles = {" ".join(tokens)} if tokens else set()
+    else:
+        shingles = {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+    return np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64)
+
+
+class NearDuplicateIndex:
+    """MinHash + LSH index that maps near-duplicate documents to one canonical key.
+
+    Each document is reduced to a MinHash signature; the signature is cut into
+    bands and each band is hashed into a bucket, so a lookup only compares
+    against documents sharing at least one bucket rather than the whole corpus.
+    Candidates are confirmed by their estimated Jaccard similarity.
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, num_perm=DEFAULT_NUM_PERM,
+                 bands=DEFAULT_BANDS, shingle_size=DEFAULT_SHINGLE_SIZE,
+                 min_shingles=DEFAULT_MIN_SHINGLES, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands.")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.min_shingles = min_shingles
+
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, 1 << 32, size=num_perm).astype(np.uint64)
+        self.b = rng.randint(0, 1 << 32, size=num_perm).astype(np.uint64)
+
+        self.signatures = {}                          # key -> signature
+        self.buckets = [{} for _ in range(bands)]     # band -> {band bytes: [keys]}
+        self.canonical = {}                           # key -> canonical key
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def signature(self, text):
+        """MinHash signature of text, or None if it has fewer than min_shingles shingles."""
+        hashes = shingle_hashes(text, self.shingle_size)
+        if hashes.size < max(self.min_shingles, 1):
+            return None
+
+        # Universal hashing (a*x + b mod p); uint64 wrap-around is intentional.
+        with np.errstate(over="ignore"):
+            permuted = (np.outer(self.a, hashes) + self.b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1)
+
+    def _band_keys(self, sig):
+        return [sig[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def _find(self, key, sig, band_keys):
+        candidates = set()
+        for band, band_key in zip(self.buckets, band_keys):
+            candidates.update(band.get(band_key, ()))
+        candidates.discard(key)  # a re-fetched page is not a duplicate of itself
+
+        best, best_score = None, self.threshold
+        for candidate in candidates:
+            score = float(np.mean(self.signatures[candidate] == sig))
+            if score >= best_score:
+                best, best_score = candidate, score
+
+        return None if best is None else self.canonical[best]
+
+    def add(self, key, text):
+        """Index a document and return its canonical key (key itself if it is new).
+
+        Documents too short to sign (e.g. empty bodies) are never indexed or
+        matched: every one of them would otherwise share the same signature.
+        """
+        sig = self.signature(text)
+        if sig is None:
+            if key in self.signatures:
+                self._remove(key)
+            self.canonical[key] = key
+            return key
+
+        band_keys = self._band_keys(sig)
+        match = self._find(key, sig, band_keys)
+
+        if match is not None:
+            # A canonical page re-fetched as a copy of another must stop
+            # attracting matches for its old body.
+            if key in self.signatures:
+                self._remove(key)
+            self.canonical[key] = match
+            return match
+
+        if key in self.signatures:
+            self._remove(key)
+
+        self.signatures[key] = sig
+        self.canonical[key] = key
+        for band, band_key in zip(self.buckets, band_keys):
+            band.setdefault(band_key, []).append(key)
+        return key
+
+    def _remove(self, key):
+        for band, band_key in zip(self.buckets, self._band_keys(self.signatures.pop(key))):
+            band[band_key].remove(key)
+            if not band[band_key]:
+                del band[band_key]
@@ -0,0 +1,115 @@
+# embed_articles.py
+"""Precompute sentence-transformer embeddings for semantic search.
+
+Loads the corpus the app serves, encodes every article in batches on CPU and
+writes the unit-length vectors next to the local corpus snapshot
+(embedding_index.EMBEDDINGS_PATH) as int8 codes with per-vector scales, or as
+float16 with --dtype float16; the app memory-maps them. An
+IVF index over the vectors (ann_index.py) is built alongside for approximate
+search. Rerun after the corpus changes; stale embeddings are ignored by the app.
+
+    python embed_articles.py --batch-size 64 --nlist 256
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from ann_index import IvfIndex
+from articles import normalize_articles
+from embedding_index import (
+    ANN_DIR, ANN_META_PATH, ANN_MATCH_KEYS, DEFAULT_MODEL, EMBEDDINGS_PATH,
+    EMBEDDINGS_SCALES_PATH, EMBEDDINGS_META_PATH, embedding_text, get_model,
+)
+from load_data_supabase import load_fraud_data, write_json
+from quantization import quantize_int8
+from search_index import corpus_fingerprint
+
+DEFAULT_BATCH_SIZE = 64
+DTYPES = ["int8", "float16"]
+
+
+def embed(texts, model=DEFAULT_MODEL, batch_size=DEFAULT_BATCH_SIZE, dtype="int8",
+          path=EMBEDDINGS_PATH, scales_path=EMBEDDINGS_SCALES_PATH):
+    """Encode texts into an int8 or float16 .npy at path, one batch at a time.
+
+    int8 codes get their per-row scales in scales_path.
+    """
+    encoder = get_model(model)
+    dim = encoder.get_sentence_embedding_dimension()
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    out = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.dtype(dtype), shape=(len(texts), dim))
+    scales = np.ones(len(texts), dtype=np.float32)
+
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start:start + batch_size]
+        vectors = encoder.encode(
+            batch, batch_size=batch_size, normalize_embeddings=True, convert_to_numpy=True
+        )
+        if dtype == "int8":
+            vectors, scales[start:start + len(batch)] = quantize_int8(vectors)
+        out[start:start + len(batch)] = vectors
+        print(f"[+] Encoded {start + len(batch)}/{len(texts)} articles")
+
+    out.flush()
+    del out
+    os.replace(tmp, path)
+    if dtype == "int8":
+        np.save(scales_path, scales)
+    return dim
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Embed the article corpus for semantic search.")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="sentence-transformers model name")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="articles encoded per batch")
+    parser.add_argument("--dtype", choices=DTYPES, default="int8",
+                        help="storage format of the embeddings")
+    parser.add_argument("--nlist", type=int, default=None,
+                        help="IVF clusters (default: sqrt of the article count)")
+    parser.add_argument("--no-ann", action="store_true",
+                        help="skip the ANN index; semantic search scans every embedding")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    df = normalize_articles(load_fraud_data())
+    texts = embedding_text(df)
+
+    # Invalidate the old embeddings, and the IVF index built over them, before overwriting them.
+    for path in [EMBEDDINGS_META_PATH, ANN_META_PATH]:
+        if os.path.exists(path):
+            os.remove(path)
+
+    start = time.perf_counter()
+    dim = embed(texts, args.model, args.batch_size, args.dtype)
+    meta = {
+        "model": args.model,
+        "dim": dim,
+        "dtype": args.dtype,
+        "rows": len(texts),
+        "fingerprint": corpus_fingerprint(df),
+        "created_at": time.time(),
+    }
+
+    if not args.no_ann and texts:
+        scales = np.load(EMBEDDINGS_SCALES_PATH) if args.dtype == "int8" else None
+        ann = IvfIndex.build(np.load(EMBEDDINGS_PATH, mmap_mode="r"), args.nlist, scales=scales)
+        ann.save(ANN_DIR, {key: meta[key] for key in ANN_MATCH_KEYS})
+        print(f"[+] Built IVF index with {ann.nlist} clusters -> {ANN_DIR}")
+
+    # Meta last: embeddings are only used once the corpus they match is recorded.
+    write_json(meta, EMBEDDINGS_META_PATH)
+
+    print(f"[✓] Embedded {len(texts)} articles ({dim}-d) in {time.perf_counter() - start:.1f}s "
+          f"-> {EMBEDDINGS_PATH}")
+
+
+if __name__ == "__main__":
+    main()
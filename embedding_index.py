@@ -0,0 +1,113 @@
+# embedding_index.py
+"""Query-time side of semantic search.
+
+Article embeddings are computed offline by embed_articles.py and stored next
+to the corpus snapshot, as int8 codes with per-vector scales (quantization.py)
+or as float16; here they are memory-mapped and only the query is encoded.
+When embed_articles.py also built an IVF index (ann_index.py), searches scan
+only the clusters nearest the query.
+
+sentence-transformers (and torch) are imported the first time a query is
+encoded, so pages that never search semantically never load them.
+"""
+import json
+import os
+import threading
+
+import numpy as np
+
+from ann_index import IvfIndex
+from load_data_supabase import SNAPSHOT_DIR
+from quantization import dot_scores
+from search_index import corpus_fingerprint, top_k
+
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDINGS_PATH = os.path.join(SNAPSHOT_DIR, "embeddings.npy")
+EMBEDDINGS_SCALES_PATH = os.path.join(SNAPSHOT_DIR, "embeddings_scales.npy")
+EMBEDDINGS_META_PATH = os.path.join(SNAPSHOT_DIR, "embeddings.json")
+ANN_DIR = os.path.join(SNAPSHOT_DIR, "ann")
+ANN_META_PATH = os.path.join(ANN_DIR, "meta.json")
+
+# The IVF index is only used with the embeddings run that built it.
+ANN_MATCH_KEYS = ["fingerprint", "model", "dtype", "created_at"]
+
+_models = {}
+_models_lock = threading.Lock()
+
+
+def get_model(name=DEFAULT_MODEL):
+    """Shared SentenceTransformer on CPU, loaded on first use."""
+    if name not in _models:
+        with _models_lock:
+            if name not in _models:
+                from sentence_transformers import SentenceTransformer
+
+                _models[name] = SentenceTransformer(name, device="cpu")
+    return _models[name]
+
+
+def embedding_text(df):
+    """What gets embedded per article: its title and summary."""
+    return (df["title"] + ". " + df["summary"]).tolist()
+
+
+class EmbeddingIndex:
+    """Unit-length article embeddings (rows aligned with the articles)."""
+
+    def __init__(self, embeddings, model=DEFAULT_MODEL, ann=None, scales=None):
+        self.embeddings = embeddings    # float16, or int8 codes
+        self.scales = scales            # per-row scales of int8 codes, else None
+        self.model = model
+        self.ann = ann                  # optional IvfIndex over the same embeddings
+
+    def __len__(self):
+        return self.embeddings.shape[0]
+
+    def encode(self, query):
+        vec = get_model(self.model).encode([query], normalize_embeddings=True, convert_to_numpy=True)
+        return vec[0].astype(np.float32)
+
+    def scores(self, query, rows=None):
+        """Cosine similarity of query against every article (or just `rows`)."""
+        return self.score_vector(self.encode(query), rows)
+
+    def score_vector(self, query_vec, rows=None):
+        """Like scores(), for a query that is already encoded."""
+        if rows is None:
+            return dot_scores(self.embeddings, query_vec, self.scales)
+        scales = None if self.scales is None else self.scales[rows]
+        return dot_scores(self.embeddings[rows], query_vec, scales)
+
+    def search(self, query, k=10):
+        """The k best articles for query as ranked (index, score) pairs."""
+        return self.search_vector(self.encode(query), k)
+
+    def search_vector(self, query_vec, k=10):
+        """search() for an encoded query; approximate when an ANN index is loaded."""
+        if self.ann is not None:
+            return self.ann.search_vector(query_vec, k)
+        scores = self.score_vector(query_vec)
+        return [(int(i), float(scores[i])) for i in top_k(scores, k)]
+
+
+def load_embeddings(df, path=EMBEDDINGS_PATH, meta_path=EMBEDDINGS_META_PATH):
+    """EmbeddingIndex for df if the stored embeddings were built from it, else None."""
+    if not os.path.exists(meta_path) or not os.path.exists(path):
+        return None
+
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("fingerprint") != corpus_fingerprint(df):
+        print("[!] Stored embeddings are for a different corpus; run embed_articles.py")
+        return None
+
+    ann, ann_meta = IvfIndex.load(ANN_DIR)
+    if ann is not None and any(ann_meta.get(key) != meta.get(key) for key in ANN_MATCH_KEYS):
+        print("[!] Stored IVF index is for other embeddings; searching without it")
+        ann = None
+
+    scales = None
+    if meta.get("dtype") == "int8":
+        scales = np.load(EMBEDDINGS_SCALES_PATH)
+
+    return EmbeddingIndex(np.load(path, mmap_mode="r"), meta["model"], ann, scales)
@@ -0,0 +1,166 @@
+# enrich_articles.py
+"""Turn scraped articles (fraud_articles.csv) into the enriched fraud_analysis_final.csv.
+
+Each article gets extracted keywords and an extractive summary from one spaCy
+pass. Only articles that are new or whose title/content changed since the last
+run (tracked by content_hash) are processed; every other row is carried over.
+
+    python -m spacy download en_core_web_sm
+    python enrich_articles.py --n-process 4
+"""
+import argparse
+import heapq
+import os
+from collections import Counter
+from datetime import datetime
+
+import pandas as pd
+
+from crawl_state import content_hash
+
+DEFAULT_INPUT = "fraud_articles.csv"
+DEFAULT_OUTPUT = "fraud_analysis_final.csv"
+DEFAULT_MODEL = "en_core_web_sm"
+DEFAULT_BATCH_SIZE = 32
+TOP_KEYWORDS = 6
+SUMMARY_SENTENCES = 3
+
+OUTPUT_COLUMNS = ["title", "url", "summary", "keywords", "timestamp", "content_hash"]
+
+
+# ==========================================
+# Extraction
+# ==========================================
+
+def _is_content_word(token):
+    return token.is_alpha and not token.is_stop
+
+
+def extract_keywords(doc, top_n=TOP_KEYWORDS):
+    """Most frequent 1–3 word noun phrases (lemmatized, stopwords removed)."""
+    counts = Counter()
+    for chunk in doc.noun_chunks:
+        words = [t.lemma_.lower() for t in chunk if _is_content_word(t)]
+        if 0 < len(words) <= 3:
+            counts[" ".join(words)] += 1
+    return [kw for kw, _ in counts.most_common(top_n)]
+
+
+def summarize(doc, max_sentences=SUMMARY_SENTENCES):
+    """Extractive summary: the sentences richest in the document's frequent words."""
+    freqs = Counter(t.lemma_.lower() for t in doc if _is_content_word(t))
+    if not freqs:
+        return ""
+
+    top = max(freqs.values())
+    scored = []
+    for i, sent in enumerate(doc.sents):
+        text = sent.text.strip()
+        # Article paragraphs are one line each; multi-line "sentences" are runs of
+        # navigation/footer fragments with no terminal punctuation.
+        if "\n" in text or not text.endswith((".", "!", "?")):
+            continue
+
+        words = [t for t in sent if _is_content_word(t)]
+        if len(words) < 5:
+            continue  # headings, bylines, link text
+        score = sum(freqs[t.lemma_.lower()] for t in words) / (top * len(words))
+        scored.append((score, i, text))
+
+    best = heapq.nlargest(max_sentences, scored)
+    return " ".join(text for _, _, text in sorted(best, key=lambda s: s[1]))
+
+
+# ==========================================
+# Incremental Batch
+# ==========================================
+
+def load_articles(path):
+    df = pd.read_csv(path).fillna("")
+    df["content_hash"] = [
+        content_hash(f"{title}\n{content}") for title, content in zip(df["title"], df["content"])
+    ]
+    return df
+
+
+def load_existing(path):
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=OUTPUT_COLUMNS)
+
+    df = pd.read_csv(path)
+    if "content_hash" not in df.columns:
+        df["content_hash"] = ""
+    return df
+
+
+def pending_articles(articles, existing):
+    """Articles whose URL is new or whose content hash differs from the enriched row."""
+    known = dict(zip(existing["url"], existing["content_hash"].fillna("")))
+    changed = [known.get(url) != h for url, h in zip(articles["url"], articles["content_hash"])]
+    return articles[changed]
+
+
+def enrich(articles, model=DEFAULT_MODEL, n_process=1, batch_size=DEFAULT_BATCH_SIZE):
+    """Run the spaCy pipeline over articles and return enriched rows."""
+    import spacy
+
+    # NER isn't used; dropping it roughly halves the pipeline cost.
+    nlp = spacy.load(model, disable=["ner"])
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    records = articles.to_dict("records")
+    # Context is the row position so it pickles cheaply to n_process workers.
+    texts = ((f"{r['title']}\n{r['content']}", i) for i, r in enumerate(records))
+
+    rows = []
+    for doc, i in nlp.pipe(texts, as_tuples=True, n_process=n_process, batch_size=batch_size):
+        rows.append({
+            "title": records[i]["title"],
+            "url": records[i]["url"],
+            "summary": summarize(doc),
+            "keywords": ", ".join(extract_keywords(doc)),
+            "timestamp": timestamp,
+            "content_hash": records[i]["content_hash"],
+        })
+
+    return pd.DataFrame(rows, columns=OUTPUT_COLUMNS)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Enrich scraped fraud articles.")
+    parser.add_argument("--input", default=DEFAULT_INPUT)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="spaCy pipeline to load")
+    parser.add_argument("--n-process", type=int, default=1,
+                        help="worker processes for nlp.pipe")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="documents per nlp.pipe batch")
+    parser.add_argument("--force", action="store_true",
+                        help="re-enrich every article, not just new or changed ones")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    articles = load_articles(args.input)
+    existing = load_existing(args.output)
+    todo = articles if args.force else pending_articles(articles, existing)
+
+    print(f"[+] {len(todo)} of {len(articles)} articles are new or changed")
+    if todo.empty:
+        print(f"[✓] {args.output} is up to date")
+        return
+
+    enriched = enrich(todo, args.model, args.n_process, args.batch_size)
+
+    # Carry over every row that was not re-enriched (including rows from other sources).
+    kept = existing[~existing["url"].isin(enriched["url"])]
+    df = pd.concat([kept, enriched], ignore_index=True)
+    df.to_csv(args.output, index=False, encoding="utf-8")
+
+    print(f"[✓] Enriched {len(enriched)} articles — {len(df)} rows in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
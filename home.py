@@ -1,12 +1,11 @@
 import streamlit as st
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from datetime import datetime
 import streamlit.components.v1 as components
 
 from intellifraud_ui import inject_light_ui
-from load_data_supabase import load_fraud_data
+from dataset import get_snapshot
+from query_cache import QUERY_CACHE, normalize_query
 
 # -------------------------------------------------
 # PAGE SETUP
@@ -95,61 +94,61 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # -------------------------------------------------
-# LOAD ARTICLES FROM SUPABASE
+# LOAD ARTICLES + SEARCH INDEXES (shared, refreshed in the background)
 # -------------------------------------------------
-@st.cache_data
-def load_articles():
-    df = load_fraud_data()
-    df.columns = [c.lower() for c in df.columns]
-
-    for col in ["title", "summary", "keywords", "url"]:
-        if col not in df.columns:
-            df[col] = ""
-
-    # Convert keyword lists → clean string
-    def fix_kw(x):
-        if isinstance(x, list):
-            return ", ".join(x)
-        return str(x)
-
-    df["keywords"] = df["keywords"].apply(fix_kw)
-    df["title"] = df["title"].fillna("Untitled Article")
-    df["summary"] = df["summary"].fillna("")
-
-    df["search_text"] = (
-        df["title"] + " " + df["summary"] + " " + df["keywords"]
-    ).str.lower()
-
-    return df
-
-df = load_articles()
-
-# -------------------------------------------------
-# TF-IDF MODEL
-# -------------------------------------------------
-@st.cache_resource
-def build_tfidf(df):
-    vectorizer = TfidfVectorizer(stop_words="english")
-    matrix = vectorizer.fit_transform(df["search_text"])
-    return vectorizer, matrix
+snapshot = get_snapshot()
+df = snapshot.articles_view()
+
+# Ranking mode label -> (snapshot index, score label, score decimals)
+RANKING_MODES = {
+    "TF-IDF (cosine)": ("tfidf", "Similarity Score", 2),
+    "BM25": ("bm25", "BM25 Score", 2),
+    "Semantic (BERT)": ("embeddings", "Semantic Score", 2),
+    "Hybrid (BM25 + BERT)": ("hybrid", "Fusion Score (RRF)", 4),
+}
 
-vectorizer, tfidf_matrix = build_tfidf(df)
+# Semantic search needs embeddings precomputed by embed_articles.py.
+RANKING_MODES = {
+    label: mode for label, mode in RANKING_MODES.items()
+    if snapshot.index(mode[0]) is not None
+}
 
 # -------------------------------------------------
 # MATCH FUNCTION
 # -------------------------------------------------
-def best_article_match(query):
+def best_article_match(query, index, k=20, **search_options):
+    """Best article for query plus the top-k (index, score) hits it heads."""
     if df.empty:
         return None, 0.0, []
 
-    query_vec = vectorizer.transform([query.lower()])
-    scores = cosine_similarity(query_vec, tfidf_matrix).flatten()
-    idx = scores.argmax()
+    hits = index.search(query, k, **search_options)
+    if not hits:
+        return None, 0.0, hits
+    idx, score = hits[0]
 
     if idx >= len(df):
-        return None, 0.0, scores
+        return None, 0.0, hits
 
-    return df.iloc[idx], float(scores[idx]), scores
+    return df.iloc[idx], score, hits
+
+
+def related_articles(hits, limit=3, min_shared=2):
+    """Up to `limit` later hits sharing at least `min_shared` keyword words with the first."""
+    overlap = snapshot.index("keyword_overlap")
+    base = hits[0][0]
+    others = hits[1:]
+    chosen = overlap.related(base, [idx for idx, _ in others], min_shared, limit)
+    return [(others[i][0], others[i][1], overlap.shared(base, others[i][0])) for i in chosen]
+
+
+def run_search(query, index_name):
+    """(article, score, related, timings) for query under one ranking mode."""
+    # Hybrid search reports how long each stage took.
+    timings = {}
+    options = {"timings": timings} if index_name == "hybrid" else {}
+    article, score, hits = best_article_match(query, snapshot.index(index_name), **options)
+    related = related_articles(hits) if article is not None else []
+    return article, score, related, timings
 
 # -------------------------------------------------
 # SEARCH BAR
@@ -161,11 +160,19 @@ query = st.text_input(
     placeholder="Try: 'mail theft', 'investment fraud', 'AI trading', 'identity theft'..."
 )
 
+ranking = st.radio("Ranking:", list(RANKING_MODES), horizontal=True)
+index_name, score_label, decimals = RANKING_MODES[ranking]
+
 # -------------------------------------------------
 # PROCESS SEARCH
 # -------------------------------------------------
 if query:
-    article, score, score_list = best_article_match(query)
+    # Reruns (button clicks, widget changes) and other sessions asking the same
+    # question reuse the result until the corpus snapshot is replaced.
+    (article, score, related, timings), cached = QUERY_CACHE.get_or_compute(
+        (snapshot.generation, index_name, normalize_query(query)),
+        lambda: run_search(query, index_name),
+    )
 
     if article is None:
         st.error("⚠️ No matching results found!")
@@ -174,7 +181,8 @@ if query:
             "query": query,
             "article_title": article["title"],
             "similarity_score": round(score, 4),
-            "keywords": article["keywords"],
+            "ranking": ranking,
+            "keywords": article["keywords_text"],
             "url": article["url"],
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         })
@@ -184,37 +192,32 @@ if query:
         <div class="card">
             <h3>{article['title']}</h3>
             <p>{article['summary']}</p>
-            <p><strong>Keywords:</strong> {article['keywords']}</p>
-            <p><strong>Similarity Score:</strong> {score:.2f}</p>
+            <p><strong>Keywords:</strong> {article['keywords_text']}</p>
+            <p><strong>{score_label}:</strong> {score:.{decimals}f}</p>
             <a href="{article['url']}" target="_blank"><strong>Read Full Article →</strong></a>
         </div>
         """, unsafe_allow_html=True)
 
+        stats = QUERY_CACHE.stats()
+        if cached:
+            st.caption(f"Cached result · query cache: {stats['hits']} hits / {stats['misses']} misses")
+        elif timings:
+            st.caption(" · ".join(f"{stage}: {ms:.1f} ms" for stage, ms in timings.items()))
+
         # Related Articles
         st.subheader("📌 Related Articles")
 
-        base_kw = set(article["keywords"].lower().replace(",", "").split())
-        ranked = score_list.argsort()[::-1][1:20]
-
-        shown = 0
-        for idx in ranked:
+        for idx, related_score, overlap in related:
             row = df.iloc[idx]
-            overlap = base_kw & set(row["keywords"].lower().replace(",", "").split())
-
-            if len(overlap) >= 2:
-                shown += 1
-                if shown > 3:
-                    break
-
-                st.markdown(f"""
-                <div class="card">
-                    <h4>{row['title']}</h4>
-                    <p>{row['summary'][:250]}...</p>
-                    <p><strong>Shared Keywords:</strong> {', '.join(overlap)}</p>
-                    <p><strong>Similarity Score:</strong> {score_list[idx]:.2f}</p>
-                    <a href="{row['url']}" target="_blank"><strong>Read Article →</strong></a>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(f"""
+            <div class="card">
+                <h4>{row['title']}</h4>
+                <p>{row['summary'][:250]}...</p>
+                <p><strong>Shared Keywords:</strong> {', '.join(overlap)}</p>
+                <p><strong>{score_label}:</strong> {related_score:.{decimals}f}</p>
+                <a href="{row['url']}" target="_blank"><strong>Read Article →</strong></a>
+            </div>
+            """, unsafe_allow_html=True)
 
 # -------------------------------------------------
 # SEARCH HISTORY SECTION
@@ -265,6 +268,10 @@ similarity_html = """
         <li><strong>0.40 – 0.59:</strong> Moderate match</li>
         <li><strong>0.00 – 0.39:</strong> Weak match</li>
     </ul>
+
+    <p style="font-size:15px; color:#0A1A2F;">
+        BM25 scores are not capped at 1: higher means more (and rarer) query terms appear in the article.
+    </p>
 </div>
 """
 
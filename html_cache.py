@@ -0,0 +1,72 @@
+# html_cache.py
+import gzip
+import json
+import os
+import time
+
+from crawl_state import content_hash
+
+DEFAULT_CACHE_DIR = "html_cache"
+
+
+class HtmlCache:
+    """Content-addressed, gzip-compressed store of every fetched page.
+
+    objects/<ab>/<sha256>.html.gz holds each distinct page body once, and the
+    append-only index.jsonl maps every URL to the digest of its latest fetch.
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, "index.jsonl")
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self.latest = self._load_index()
+
+    def __len__(self):
+        return len(self.latest)
+
+    def __contains__(self, url):
+        return url in self.latest
+
+    def _load_index(self):
+        latest = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn final line from an interrupted run
+                    latest[entry["url"]] = entry["digest"]
+        return latest
+
+    def object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest + ".html.gz")
+
+    def put(self, url, html, digest=None):
+        """Store html fetched from url and return its digest."""
+        digest = digest or content_hash(html)
+        path = self.object_path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".tmp"
+            with gzip.open(tmp, "wt", encoding="utf-8") as f:
+                f.write(html)
+            os.replace(tmp, path)
+
+        if self.latest.get(url) != digest:
+            self.latest[url] = digest
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"url": url, "digest": digest, "fetched_at": time.time()}) + "\n")
+
+        return digest
+
+    def entries(self):
+        """(url, object path) for the latest fetch of every cached URL."""
+        return [(url, self.object_path(digest)) for url, digest in self.latest.items()]
+
+
+def read_object(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return f.read()
@@ -0,0 +1,86 @@
+# hybrid_search.py
+"""Hybrid lexical + semantic ranking with reciprocal-rank fusion.
+
+The lexical index supplies candidates. Encoding the query (the slow,
+model-bound step) runs on a worker thread at the same time, followed by an ANN
+lookup when the embeddings have one, which adds semantic candidates. The
+embedding stage then scores only the candidates, so a hybrid query costs
+little more than a lexical one. The two rankings are merged with
+reciprocal-rank fusion, which needs no calibration between BM25 and cosine
+scores.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from search_index import top_k
+
+DEFAULT_CANDIDATES = 100   # lexical hits the semantic stage re-scores
+RRF_K = 60                 # standard reciprocal-rank-fusion damping constant
+
+# Shared by every session; query encoding runs here.
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hybrid-search")
+
+
+def reciprocal_rank_fusion(rankings, k=RRF_K):
+    """{doc: sum of 1 / (k + rank)} over ranked lists of doc ids (rank from 1)."""
+    fused = {}
+    for ranking in rankings:
+        for rank, doc in enumerate(ranking, start=1):
+            fused[doc] = fused.get(doc, 0.0) + 1.0 / (k + rank)
+    return fused
+
+
+class HybridIndex:
+    """Lexical candidates re-ranked together with embedding similarity."""
+
+    def __init__(self, lexical, semantic, candidates=DEFAULT_CANDIDATES, rrf_k=RRF_K):
+        self.lexical = lexical
+        self.semantic = semantic
+        self.candidates = candidates
+        self.rrf_k = rrf_k
+
+    def search(self, query, k=10, timings=None):
+        """The k best documents as ranked (index, fused score) pairs.
+
+        If `timings` is a dict it receives per-stage wall times in ms.
+        """
+        timings = {} if timings is None else timings
+        start = time.perf_counter()
+
+        def encode():
+            t = time.perf_counter()
+            vec = self.semantic.encode(query)
+            encode_ms = (time.perf_counter() - t) * 1e3
+
+            t = time.perf_counter()
+            nearest = []
+            if self.semantic.ann is not None:
+                nearest = [doc for doc, _ in self.semantic.ann.search_vector(vec, self.candidates)]
+            return vec, nearest, encode_ms, (time.perf_counter() - t) * 1e3
+
+        encoded = _executor.submit(encode)
+
+        t = time.perf_counter()
+        lexical = self.lexical.search(query, max(k, self.candidates))
+        timings["lexical"] = (time.perf_counter() - t) * 1e3
+
+        query_vec, nearest, timings["encode"], timings["ann"] = encoded.result()
+
+        t = time.perf_counter()
+        rows = np.unique(np.array([doc for doc, _ in lexical] + nearest, dtype=np.int64))
+        if len(rows) < k and self.semantic.ann is None:
+            # Too few lexical matches (e.g. a paraphrase) and no ANN: rank the whole corpus.
+            rows = np.arange(len(self.semantic))
+        scores = self.semantic.score_vector(query_vec, rows)
+        semantic = rows[top_k(scores, len(rows))]
+        timings["semantic"] = (time.perf_counter() - t) * 1e3
+
+        t = time.perf_counter()
+        fused = reciprocal_rank_fusion([[doc for doc, _ in lexical], semantic.tolist()], self.rrf_k)
+        ranked = sorted(fused.items(), key=lambda item: -item[1])[:k]
+        timings["fusion"] = (time.perf_counter() - t) * 1e3
+
+        timings["total"] = (time.perf_counter() - start) * 1e3
+        return [(int(doc), float(score)) for doc, score in ranked]
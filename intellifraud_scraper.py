@@ -1,7 +1,22 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import argparse
+import asyncio
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin, urlparse
+
+import aiohttp
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+from crawl_state import CrawlState, DEFAULT_STATE_PATH, content_hash
+from keyword_matcher import KeywordMatcher
+from dedup import NearDuplicateIndex, DEFAULT_THRESHOLD
+from html_cache import HtmlCache, DEFAULT_CACHE_DIR, read_object
+from article_writer import (
+    ArticleWriter, DEFAULT_JSONL_PATH, DEFAULT_CHECKPOINT_EVERY, export_csv, read_articles,
+    seed_from_csv,
+)
 
 # ==========================================
 # FINRA Index Pages to Pull From Automatically
@@ -24,6 +39,83 @@ FRAUD_KEYWORDS = [
     "misleading", "securities fraud", "scam", "deceptive"
 ]
 
+FRAUD_MATCHER = KeywordMatcher(FRAUD_KEYWORDS)
+
+# Crawl Settings
+FINRA_BASE_URL = "https://www.finra.org"
+REQUEST_TIMEOUT = 10       # seconds per request
+DEFAULT_CONCURRENCY = 8    # async fetch workers
+DEFAULT_RATE = 2.0         # requests per second, per host
+DEFAULT_BURST = 2          # requests allowed back-to-back per host
+DEFAULT_MAX_PAGES = 20     # index pages followed per source
+DEFAULT_PARSE_WORKERS = os.cpu_count() or 1
+
+# Parser Backend — lxml is several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Only these tags are needed to extract an article, so skip building the rest of the tree.
+ARTICLE_TAGS = SoupStrainer(["h1", "time", "p"])
+
+
+# ==========================================
+# Per-Host Politeness Scheduler
+# ==========================================
+
+class TokenBucket:
+    """Token-bucket limiter allowing `rate` requests/sec with bursts of `burst`."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def reserve(self):
+        """Take one token and return how long the caller must wait before using it."""
+        if self.rate <= 0:
+            return 0.0
+
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        # Tokens may go negative: each caller books the next free slot.
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """One TokenBucket per host so a slow crawl of one site never throttles another."""
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+
+    def _bucket(self, url):
+        host = urlparse(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.burst)
+        return self.buckets[host]
+
+    def wait(self, url):
+        """Block the calling thread until a request to url's host is allowed."""
+        delay = self._bucket(url).reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire(self, url):
+        """Async version of wait() for use inside the event loop."""
+        delay = self._bucket(url).reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
 
 # ==========================================
 # Helper Functions
@@ -31,32 +123,34 @@ FRAUD_KEYWORDS = [
 
 def is_fraud_related(text):
     """Return True if text matches any fraud keyword."""
-    if not text:
-        return False
-    text = text.lower()
-    return any(keyword in text for keyword in FRAUD_KEYWORDS)
+    return FRAUD_MATCHER.matches_any(text)
 
 
-def fetch_index_page(url):
+def fraud_keyword_hits(text):
+    """Map each fraud keyword found in text to its character offsets."""
+    return FRAUD_MATCHER.match(text)
+
+
+def fetch_index_page(url, session=requests):
     """Download index page HTML."""
     print(f"[+] Fetching index page: {url}")
-    response = requests.get(url, timeout=10)
+    response = session.get(url, timeout=REQUEST_TIMEOUT)
 
     if response.status_code != 200:
         print(f"[!] Failed to load index page ({response.status_code})")
         return None
 
-    return BeautifulSoup(response.text, "html.parser")
+    return BeautifulSoup(response.text, HTML_PARSER)
 
 
-def extract_article_links(soup):
+def extract_article_links(soup, base_url=FINRA_BASE_URL):
     """Extract article URLs from index page."""
     links = []
 
     for a in soup.find_all("a", href=True):
         href = a["href"]
         if href.startswith("/"):
-            href = "https://www.finra.org" + href
+            href = urljoin(base_url, href)
 
         # Must contain a FINRA article-style path
         if any(x in href for x in ["/media-center/", "/enforcement/", "/disciplinary-actions/"]):
@@ -65,84 +159,446 @@ def extract_article_links(soup):
     return list(set(links))  # unique
 
 
-def scrape_article(url):
+def find_next_page(soup, page_url):
+    """Return the URL of the next index page, or None on the last page."""
+    link = soup.find("a", rel="next", href=True)
+
+    if link is None:
+        # Drupal pager markup used across finra.org
+        link = soup.select_one("li.pager__item--next a[href]")
+
+    if link is None:
+        return None
+
+    return urljoin(page_url, link["href"])
+
+
+def has_unseen_links(links, state):
+    """False once every link on an index page is already in the crawl state."""
+    if state is None:
+        return True
+    return any(link not in state for link in links)
+
+
+def parse_article(html, url, parser=HTML_PARSER):
+    """Extract title, date, and content from article HTML (no network access)."""
+    soup = BeautifulSoup(html, parser, parse_only=ARTICLE_TAGS)
+
+    # Title
+    title = soup.find("h1")
+    title = title.get_text(strip=True) if title else "No Title"
+
+    # Publication Date (REQUIRED)
+    date_tag = soup.find("time")
+    if not date_tag or not date_tag.has_attr("datetime"):
+        print(f"[!] No publication date found — skipping: {url}")
+        return None
+
+    article_date = date_tag["datetime"]
+
+    # Body Text
+    paragraphs = soup.find_all("p")
+    content = "\n".join(p.get_text(strip=True) for p in paragraphs)
+
+    # Filter out articles not related to fraud. Offsets are into "title\ncontent"
+    # and are kept as a relevance signal for downstream ranking.
+    keyword_hits = fraud_keyword_hits(title + "\n" + content)
+    if not keyword_hits:
+        print(f"[!] Not fraud-related — skipping: {url}")
+        return None
+
+    return {
+        "title": title,
+        "url": url,
+        "article_date": article_date,
+        "content": content,
+        "keyword_hits": keyword_hits,
+    }
+
+
+def check_article_response(url, status, html, headers, state=None, cache=None):
+    """Decide whether a fetched article needs parsing.
+
+    Returns the crawl-state entry to record once the article has been handled,
+    or None if it can be skipped. Recording is left to the caller so the state
+    never claims a page whose row has not reached the output yet.
+    """
+    if status == 304:
+        print(f"[=] Not modified — skipping: {url}")
+        if state is not None:
+            state.touch(url)
+        return None
+
+    if status != 200:
+        print(f"[!] Failed to load article ({status})")
+        return None
+
+    digest = content_hash(html)
+
+    if cache is not None:
+        cache.put(url, html, digest)
+
+    entry = {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "content_hash": digest,
+    }
+
+    if state is not None and not state.has_changed(url, digest):
+        print(f"[=] Content unchanged — skipping: {url}")
+        state.record(url, **entry)  # refresh validators
+        return None
+
+    return entry
+
+
+def scrape_article(url, session=requests, state=None, cache=None):
     """Scrape title, date, and content from an article URL."""
     print(f"[+] Scraping article: {url}")
 
     try:
-        response = requests.get(url, timeout=10)
+        headers = state.conditional_headers(url) if state is not None else {}
+        response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
 
-        if response.status_code != 200:
-            print(f"[!] Failed to load article ({response.status_code})")
+        entry = check_article_response(
+            url, response.status_code, response.text, response.headers, state, cache
+        )
+        if entry is None:
             return None
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        article = parse_article(response.text, url)
+        if state is not None:
+            state.record(url, **entry)
+        return article
 
-        # Title
-        title = soup.find("h1")
-        title = title.get_text(strip=True) if title else "No Title"
+    except Exception as e:
+        print(f"[ERROR] Exception scraping article: {e}")
+        return None
 
-        # Publication Date (REQUIRED)
-        date_tag = soup.find("time")
-        if not date_tag or not date_tag.has_attr("datetime"):
-            print("[!] No publication date found — skipping.")
-            return None
 
-        article_date = date_tag["datetime"]
+def parse_cached(path, url):
+    """Parse an article straight from the raw HTML cache."""
+    return parse_article(read_object(path), url)
 
-        # Body Text
-        paragraphs = soup.find_all("p")
-        content = "\n".join(p.get_text(strip=True) for p in paragraphs)
 
-        # Filter out articles not related to fraud
-        if not (is_fraud_related(title) or is_fraud_related(content)):
-            print("[!] Not fraud-related — skipping.")
-            return None
+# ==========================================
+# Async Crawl
+# ==========================================
 
-        return {
-            "title": title,
-            "url": url,
-            "article_date": article_date,
-            "content": content
-        }
+async def fetch_async(session, limiter, url, headers=None):
+    """Download a page once its host allows it. Returns (status, html, headers) or None."""
+    await limiter.acquire(url)
 
-    except Exception as e:
-        print(f"[ERROR] Exception scraping article: {e}")
+    try:
+        async with session.get(url, headers=headers) as response:
+            html = await response.text(errors="replace") if response.status == 200 else ""
+            return response.status, html, response.headers
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"[ERROR] Exception fetching {url}: {e}")
         return None
 
 
+async def discover_async(session, limiter, source, queue, seen, state=None,
+                         max_pages=DEFAULT_MAX_PAGES):
+    """Walk one source's paginated index and stream new article URLs into queue."""
+    url = source
+
+    for _ in range(max_pages):
+        print(f"[+] Fetching index page: {url}")
+        page = await fetch_async(session, limiter, url)
+        if not page or page[0] != 200:
+            print(f"[!] Failed to load index page: {url}")
+            return
+
+        soup = BeautifulSoup(page[1], HTML_PARSER)
+        next_url = find_next_page(soup, url)
+        links = [l for l in extract_article_links(soup, base_url=url) if l != next_url]
+
+        for link in links:
+            if link not in seen:
+                seen.add(link)
+                await queue.put(link)
+
+        if not has_unseen_links(links, state):
+            print(f"[=] Reached already-crawled articles — stopping at: {url}")
+            return
+
+        url = next_url
+        if url is None:
+            return
+
+
+async def crawl_async(writer, sources=FINRA_SOURCES, concurrency=DEFAULT_CONCURRENCY,
+                      rate=DEFAULT_RATE, burst=DEFAULT_BURST, state=None,
+                      max_pages=DEFAULT_MAX_PAGES, parse_workers=DEFAULT_PARSE_WORKERS,
+                      cache=None):
+    """Crawl index pages and articles as a three-stage pipeline.
+
+    discover -> fetch -> parse. Discovery of every source runs concurrently with
+    article fetching: URLs are handed to the fetch workers as soon as their index
+    page has been parsed. Fetched HTML goes through a bounded queue to a process
+    pool, so CPU-bound parsing never stalls the network loop and at most a few
+    pages per parse worker are held in memory. Articles are streamed to writer;
+    returns how many were written.
+    """
+    limiter = HostRateLimiter(rate, burst)
+    connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    pool = ProcessPoolExecutor(max_workers=parse_workers)
+    loop = asyncio.get_running_loop()
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        queue = asyncio.Queue(maxsize=concurrency * 4)
+        parse_queue = asyncio.Queue(maxsize=parse_workers * 2)
+        seen = set()
+        written = 0
+
+        async def discover():
+            await asyncio.gather(*(
+                discover_async(session, limiter, source, queue, seen, state, max_pages)
+                for source in sources
+            ))
+            print(f"[✓] Total candidate articles found: {len(seen)}")
+
+            # One sentinel per worker: no more URLs are coming.
+            for _ in range(concurrency):
+                await queue.put(None)
+
+        async def fetch_worker():
+            while True:
+                url = await queue.get()
+                if url is None:
+                    return
+
+                print(f"[+] Scraping article: {url}")
+                try:
+                    headers = state.conditional_headers(url) if state is not None else None
+                    page = await fetch_async(session, limiter, url, headers)
+                    entry = check_article_response(url, *page, state, cache) if page else None
+                except Exception as e:
+                    # One bad page must not take the whole crawl down (as in scrape_article).
+                    print(f"[ERROR] Exception scraping article {url}: {e}")
+                    continue
+
+                if entry is not None:
+                    await parse_queue.put((page[1], url, entry))
+
+        async def parse_worker():
+            nonlocal written
+            while True:
+                item = await parse_queue.get()
+                if item is None:
+                    return
+
+                html, url, entry = item
+                try:
+                    article = await loop.run_in_executor(pool, parse_article, html, url)
+                except Exception as e:
+                    print(f"[ERROR] Exception parsing article {url}: {e}")
+                    continue
+
+                if article:
+                    writer.write(article)
+                    written += 1
+                if state is not None:
+                    state.record(url, **entry)
+
+        try:
+            parsers = [asyncio.create_task(parse_worker()) for _ in range(parse_workers)]
+            await asyncio.gather(discover(), *(fetch_worker() for _ in range(concurrency)))
+
+            for _ in parsers:
+                await parse_queue.put(None)
+            await asyncio.gather(*parsers)
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    return written
+
+
 # ==========================================
 # MAIN LOGIC
 # ==========================================
 
-def main():
+def crawl_sync(writer, sources=FINRA_SOURCES, rate=DEFAULT_RATE, burst=DEFAULT_BURST,
+               state=None, max_pages=DEFAULT_MAX_PAGES, cache=None):
+    """Crawl index pages and articles one request at a time, streaming them to writer."""
+    limiter = HostRateLimiter(rate, burst)
+    session = requests.Session()
     all_links = set()
 
-    # Fetch all index pages
-    for source in FINRA_SOURCES:
-        soup = fetch_index_page(source)
-        if soup:
-            links = extract_article_links(soup)
+    # Fetch all index pages, following pagination
+    for source in sources:
+        url = source
+        for _ in range(max_pages):
+            limiter.wait(url)
+            soup = fetch_index_page(url, session)
+            if not soup:
+                break
+
+            next_url = find_next_page(soup, url)
+            links = [l for l in extract_article_links(soup, base_url=url) if l != next_url]
             all_links.update(links)
 
-        time.sleep(1)  # avoid hammering FINRA servers
+            if not has_unseen_links(links, state):
+                print(f"[=] Reached already-crawled articles — stopping at: {url}")
+                break
+
+            url = next_url
+            if url is None:
+                break
 
     print(f"[✓] Total candidate articles found: {len(all_links)}")
 
-    results = []
+    written = 0
 
     # Scrape each article
     for url in all_links:
-        article = scrape_article(url)
+        limiter.wait(url)
+        article = scrape_article(url, session, state, cache)
         if article:
-            results.append(article)
-        time.sleep(0.5)
+            writer.write(article)
+            written += 1
+
+    return written
+
+
+def reparse_cache(writer, cache, parse_workers=DEFAULT_PARSE_WORKERS):
+    """Rebuild every article from the raw HTML cache in parallel, without network access."""
+    entries = cache.entries()
+    print(f"[+] Re-parsing {len(entries)} cached pages with {parse_workers} workers")
+    written = 0
+
+    with ProcessPoolExecutor(max_workers=parse_workers) as pool:
+        paths = [path for _, path in entries]
+        urls = [url for url, _ in entries]
+        for article in pool.map(parse_cached, paths, urls, chunksize=16):
+            if article:
+                writer.write(article)
+                written += 1
+
+    return written
+
+
+def reparse_log(log_path, cache, parse_workers=DEFAULT_PARSE_WORKERS,
+                checkpoint_every=DEFAULT_CHECKPOINT_EVERY, dedup=None):
+    """Rebuild the article log from the raw HTML cache, without network access.
+
+    Rows for URLs the cache does not cover (seeded from an old CSV, crawled with
+    --no-cache or before the cache existed) are carried over as they are: the
+    crawl state would skip those pages on the next crawl, so dropping them here
+    would lose them for good. The new log is written next to the old one and
+    only replaces it once complete.
+    """
+    kept = [
+        {key: value for key, value in row.items() if key != "canonical_url" and not _is_missing(value)}
+        for row in read_articles(log_path, collapse_duplicates=False).to_dict("records")
+        if row["url"] not in cache
+    ]
+    if kept:
+        print(f"[!] {len(kept)} logged articles have no cached HTML — keeping their existing rows")
+
+    tmp = log_path + ".reparse"
+    with ArticleWriter(tmp, checkpoint_every, resume=False, dedup=dedup) as writer:
+        for row in kept:
+            writer.write(row)
+        written = reparse_cache(writer, cache, parse_workers)
+
+    os.replace(tmp + ".checkpoint", log_path + ".checkpoint")
+    os.replace(tmp, log_path)
+    return written
+
+
+def _is_missing(value):
+    return isinstance(value, float) and value != value  # NaN from a column other rows fill
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape fraud-related FINRA articles.")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="crawl with concurrent asyncio workers")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="number of async fetch workers / pooled connections")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help="max requests per second to each host (0 = unlimited)")
+    parser.add_argument("--burst", type=int, default=DEFAULT_BURST,
+                        help="requests allowed back-to-back per host")
+    parser.add_argument("--sources", nargs="+", default=FINRA_SOURCES,
+                        help="index page URLs to crawl")
+    parser.add_argument("--parse-workers", type=int, default=DEFAULT_PARSE_WORKERS,
+                        help="processes used to parse article HTML in async mode")
+    parser.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES,
+                        help="index pages to follow per source")
+    parser.add_argument("--output", default="fraud_articles.csv")
+    parser.add_argument("--log", default=DEFAULT_JSONL_PATH,
+                        help="append-only JSONL article log the output CSV is built from")
+    parser.add_argument("--checkpoint-every", type=int, default=DEFAULT_CHECKPOINT_EVERY,
+                        help="articles written between checkpoints")
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH,
+                        help="SQLite crawl-state file used for incremental recrawls")
+    parser.add_argument("--full", action="store_true",
+                        help="ignore the crawl state and rescrape every article")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_DIR,
+                        help="directory of the compressed raw HTML cache")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="do not store fetched pages in the raw HTML cache")
+    parser.add_argument("--no-dedup", action="store_true",
+                        help="keep near-duplicate articles instead of aliasing them")
+    parser.add_argument("--dedup-threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="estimated Jaccard similarity at which bodies count as duplicates")
+    parser.add_argument("--reparse", action="store_true",
+                        help="re-parse every cached page (no network); "
+                             "articles without cached HTML keep their logged rows")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    dedup = None if args.no_dedup else NearDuplicateIndex(args.dedup_threshold)
+
+    if args.reparse:
+        written = reparse_log(args.log, HtmlCache(args.cache), args.parse_workers,
+                              args.checkpoint_every, dedup)
+        df = export_csv(args.log, args.output)
+        print(f"[✓] Re-parsed {written} fraud articles into {args.output} ({len(df)} total)")
+        return
+
+    state = None if args.full else CrawlState(args.state)
+    cache = None if args.no_cache else HtmlCache(args.cache)
+
+    # Articles scraped before the JSONL log existed carry over into it.
+    if state is not None and not os.path.exists(args.log) and os.path.exists(args.output):
+        seed_from_csv(args.output, args.log, dedup)
+
+    # Crawl state is committed at every checkpoint, i.e. only once the matching
+    # rows are safely on disk — an interrupted crawl resumes from there.
+    writer = ArticleWriter(
+        args.log, args.checkpoint_every,
+        on_checkpoint=state.commit if state is not None else None,
+        resume=state is not None,
+        dedup=dedup,
+    )
 
-    # Save to CSV
-    df = pd.DataFrame(results)
-    df.to_csv("fraud_articles.csv", index=False, encoding="utf-8")
+    try:
+        if args.use_async:
+            written = asyncio.run(crawl_async(
+                writer, args.sources, args.concurrency, args.rate, args.burst, state=state,
+                max_pages=args.max_pages, parse_workers=args.parse_workers, cache=cache,
+            ))
+        else:
+            written = crawl_sync(
+                writer, args.sources, args.rate, args.burst, state=state,
+                max_pages=args.max_pages, cache=cache,
+            )
+    finally:
+        writer.close()
+        if state is not None:
+            state.close()
 
-    print(f"[✓] Saved {len(results)} fraud articles to fraud_articles.csv")
+    # Save to CSV
+    df = export_csv(args.log, args.output)
+    print(f"[✓] Saved {written} new/updated fraud articles to {args.output} ({len(df)} total)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+# keyword_matcher.py
+import re
+from collections import defaultdict
+
+
+def _trie_pattern(node):
+    """Regex for a character trie; prefers the longest keyword at each position."""
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # A keyword ends here but longer ones continue: make the rest optional (greedy).
+        return "(?:" + body + ")?"
+    return body
+
+
+class KeywordMatcher:
+    """Find every occurrence of many keywords in a single pass over the text.
+
+    The keywords are compiled into one trie-shaped regex wrapped in a lookahead,
+    so matching costs one scan of the document regardless of how many keywords
+    there are, and overlapping hits ("securities fraud" / "fraud") are all
+    reported. Matching is case-insensitive and, like the old substring check,
+    not limited to word boundaries ("fraud" also hits "fraudsters").
+    """
+
+    def __init__(self, keywords):
+        self.keywords = sorted({k.lower() for k in keywords if k})
+
+        trie = {}
+        for keyword in self.keywords:
+            node = trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node[""] = True
+
+        self.regex = re.compile("(?=(" + _trie_pattern(trie) + "))", re.IGNORECASE)
+
+        # The regex reports the longest keyword starting at a position; shorter
+        # keywords that are prefixes of it start there too.
+        self.prefixes = {
+            keyword: [k for k in self.keywords if keyword.startswith(k)]
+            for keyword in self.keywords
+        }
+
+    def finditer(self, text):
+        """Yield (keyword, start, end) for every keyword occurrence in text."""
+        if not text or not self.keywords:
+            return
+
+        for m in self.regex.finditer(text):
+            start = m.start(1)
+            longest = m.group(1).lower()
+            for keyword in self.prefixes.get(longest, [longest]):
+                yield keyword, start, start + len(keyword)
+
+    def match(self, text):
+        """Map each keyword found in text to the list of its start offsets."""
+        hits = defaultdict(list)
+        for keyword, start, _ in self.finditer(text):
+            hits[keyword].append(start)
+        return dict(hits)
+
+    def matches_any(self, text):
+        """True if text contains at least one keyword (stops at the first hit)."""
+        if not text or not self.keywords:
+            return False
+        return self.regex.search(text) is not None
@@ -0,0 +1,66 @@
+# keyword_overlap.py
+"""Shared-keyword counts between articles from a sparse incidence matrix.
+
+Related articles are the search hits that share at least a couple of keyword
+words with the best match; words are what set(keywords_text.replace(",",
+"").split()) yields, so "identity theft" and "mail theft" share "theft".
+Instead of re-parsing every hit's keyword string, each article's words are
+stored once as a row of a 0/1 articles x words CSR matrix, and the overlap of
+one article with any set of candidates is one sparse row product.
+"""
+import numpy as np
+
+from keyword_table import KeywordTable
+
+
+class KeywordOverlapIndex:
+    """Binary articles x keyword-word matrix for counting shared keyword words."""
+
+    def __init__(self, matrix, terms):
+        self.matrix = matrix      # CSR (articles, words), sorted indices, data all 1
+        self.terms = terms        # word id -> word (object array)
+
+    @classmethod
+    def from_keywords(cls, keywords):
+        """Build from a KeywordTable, splitting multi-word keywords into words."""
+        # keyword -> words is itself a small CSR table over the word vocabulary.
+        words = KeywordTable.from_lists(kw.replace(",", "").split() for kw in keywords.vocabulary)
+        matrix = (keywords.incidence() @ words.incidence()).tocsr()
+        matrix.sum_duplicates()
+        matrix.data[:] = 1     # an article has a word or it does not
+        return cls(matrix, words.vocabulary)
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def words(self, row):
+        """Sorted word ids of article `row`."""
+        return self.matrix.indices[self.matrix.indptr[row]:self.matrix.indptr[row + 1]]
+
+    def overlap(self, row, candidates):
+        """Number of keyword words article `row` shares with each candidate article.
+
+        The candidates' rows times the row's 0/1 word vector, computed on the
+        CSR arrays directly: scipy's row fancy-indexing costs more than the
+        product itself for a few dozen hits.
+        """
+        candidates = np.asarray(candidates, dtype=np.int64)
+        indptr, indices = self.matrix.indptr, self.matrix.indices
+
+        base = np.zeros(len(self.terms), dtype=bool)
+        base[self.words(row)] = True
+
+        starts = indptr[candidates]
+        lengths = indptr[candidates + 1] - starts
+        # Position of every entry of the candidate rows in `indices`.
+        positions = np.arange(lengths.sum()) + np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        owners = np.repeat(np.arange(len(candidates)), lengths)
+        return np.bincount(owners, weights=base[indices[positions]], minlength=len(candidates)).astype(np.int64)
+
+    def shared(self, row, other):
+        """The keyword words two articles have in common."""
+        return self.terms[np.intersect1d(self.words(row), self.words(other), assume_unique=True)].tolist()
+
+    def related(self, row, candidates, min_shared=2, limit=3):
+        """Positions in candidates (in order) sharing at least min_shared words with row."""
+        return np.flatnonzero(self.overlap(row, candidates) >= min_shared)[:limit]
@@ -0,0 +1,89 @@
+# keyword_table.py
+import itertools
+
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+import scipy.sparse as sp
+
+
+class KeywordTable:
+    """Per-article keyword lists as interned integer IDs in CSR layout.
+
+    Every distinct keyword is stored once in `vocabulary`; article i's keywords
+    are vocabulary[values[offsets[i]:offsets[i + 1]]]. Two flat integer arrays
+    replace one Python list (and one str object per keyword) per article.
+    """
+
+    def __init__(self, vocabulary, offsets, values):
+        self.vocabulary = vocabulary              # keyword id -> keyword (object array)
+        self.offsets = offsets                    # int64, len(articles) + 1
+        self.values = values                      # int32 keyword ids
+
+    @classmethod
+    def from_lists(cls, lists):
+        """Build from an iterable of keyword lists (one per article)."""
+        lists = list(lists)
+        lengths = np.fromiter((len(kws) for kws in lists), dtype=np.int64, count=len(lists))
+        flat = np.fromiter(itertools.chain.from_iterable(lists), dtype=object, count=int(lengths.sum()))
+        return cls.from_flat(flat, lengths)
+
+    @classmethod
+    def from_arrow(cls, lists):
+        """Build from an Arrow list<string> array without touching Python lists."""
+        encoded = pc.dictionary_encode(lists.flatten())
+        offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+        np.cumsum(pc.list_value_length(lists).to_numpy(), out=offsets[1:])
+        return cls(
+            encoded.dictionary.to_numpy(zero_copy_only=False),
+            offsets,
+            encoded.indices.to_numpy().astype(np.int32),
+        )
+
+    @classmethod
+    def from_flat(cls, keywords, lengths):
+        """Build from all keywords concatenated in article order plus per-article counts."""
+        codes, vocabulary = pd.factorize(np.asarray(keywords, dtype=object))
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(np.asarray(vocabulary, dtype=object), offsets, codes.astype(np.int32))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self):
+        vocab = sum(len(kw.encode("utf-8")) for kw in self.vocabulary)
+        return vocab + self.offsets.nbytes + self.values.nbytes
+
+    def ids(self, i):
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+    def row(self, i):
+        """Keywords of article i as a list of strings."""
+        return self.vocabulary[self.ids(i)].tolist()
+
+    def rows(self):
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    def row_index(self):
+        """Article index of every entry in `values`."""
+        return np.repeat(np.arange(len(self)), self.lengths())
+
+    def frequencies(self):
+        """Occurrences of every keyword id across all articles."""
+        return np.bincount(self.values, minlength=len(self.vocabulary))
+
+    def row_sums(self, weights):
+        """Per-article sum of weights[keyword id] over the article's keywords."""
+        weights = np.asarray(weights, dtype=np.float64)
+        return np.bincount(self.row_index(), weights=weights[self.values], minlength=len(self))
+
+    def incidence(self, dtype=np.int32):
+        """Sparse articles x vocabulary 0/1 matrix sharing this table's CSR arrays."""
+        ones = np.ones(len(self.values), dtype=dtype)
+        return sp.csr_matrix((ones, self.values, self.offsets), shape=(len(self), len(self.vocabulary)))
@@ -1,24 +1,238 @@
 # load_data_supabase.py
-import pandas as pd
 import io
-from supabase_client import supabase, SUPABASE_BUCKET, SUPABASE_CSV_PATH
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+
+from storage_backend import get_storage
+from supabase_client import SUPABASE_CSV_PATH
+
+# Partitioned corpus: one CSV per month plus a manifest listing them (see publish_corpus.py).
+MANIFEST_PATH = "csv/articles-fraud/manifest.json"
+
+# Local snapshot of the cleaned DataFrame, reused until the remote CSV changes.
+SNAPSHOT_DIR = os.getenv("INTELLIFRAUD_CACHE_DIR", ".intellifraud_cache")
+SNAPSHOT_PATH = os.path.join(SNAPSHOT_DIR, "articles.arrow")
+SNAPSHOT_META_PATH = os.path.join(SNAPSHOT_DIR, "articles.json")
+PARTS_DIR = os.path.join(SNAPSHOT_DIR, "parts")
+PARTS_META_PATH = os.path.join(PARTS_DIR, "manifest.json")
+
+# Canonical keyword column: one Arrow list of lowercase strings per article.
+KEYWORD_TYPE = pa.list_(pa.string())
+KEYWORD_DTYPE = pd.ArrowDtype(KEYWORD_TYPE)
+
 
-def load_fraud_data():
-    """Loads FINRA fraud CSV stored in Supabase bucket."""
-    res = supabase.storage.from_(SUPABASE_BUCKET).download(SUPABASE_CSV_PATH)
+def normalize_keywords(values):
+    """Comma-separated keyword strings -> Arrow list array of canonical keywords.
 
-    if res is None:
-        raise ValueError("Failed to download CSV from Supabase.")
+    Splits on commas, strips whitespace, lowercases, drops empty entries and
+    duplicates within an article (first occurrence wins), all with Arrow
+    compute kernels over the whole column rather than per-cell Python.
+    """
+    text = pa.array(pd.Series(values).fillna("").astype(str), type=pa.string())
+    parts = pc.split_pattern(text, ",")
 
-    df = pd.read_csv(io.BytesIO(res))
+    keywords = pc.utf8_lower(pc.utf8_trim_whitespace(parts.flatten()))
+    rows = pc.list_parent_indices(parts).to_numpy().astype(np.int64)
+    ids = pc.dictionary_encode(keywords).indices.to_numpy()
 
+    keep = pc.not_equal(keywords, "").to_numpy(zero_copy_only=False)
+    keep &= ~pd.Series(rows * (ids.max(initial=0) + 1) + ids).duplicated().to_numpy()
+
+    offsets = np.zeros(len(text) + 1, dtype=np.int32)
+    np.cumsum(np.bincount(rows[keep], minlength=len(text)), out=offsets[1:])
+    return pa.ListArray.from_arrays(pa.array(offsets), keywords.filter(pa.array(keep)))
+
+
+def clean_fraud_data(df):
+    """Normalize the raw CSV columns."""
     # clean + ensure consistent formats
     df["summary"] = df["summary"].astype(str)
-    df["keywords"] = df["keywords"].astype(str)
 
-    # turn keywords into lists
-    df["keywords"] = df["keywords"].fillna("").apply(
-        lambda x: [k.strip().lower() for k in x.split(",") if k.strip()]
+    # turn keywords into lists (Arrow-backed; one vectorized pass per load)
+    df["keywords"] = pd.Series(
+        pd.arrays.ArrowExtensionArray(normalize_keywords(df["keywords"])), index=df.index
     )
 
     return df
+
+
+def read_snapshot(source, version):
+    """Memory-map the local snapshot if it was built from `version` of source."""
+    if not os.path.exists(SNAPSHOT_META_PATH) or not os.path.exists(SNAPSHOT_PATH):
+        return None
+
+    with open(SNAPSHOT_META_PATH, encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("source") != source:
+        return None
+    if version is not None and meta.get("version") != version:
+        return None
+
+    return table_to_frame(feather.read_table(SNAPSHOT_PATH, memory_map=True))
+
+
+def write_snapshot(df, source, version):
+    """Save the cleaned DataFrame as an uncompressed (mmap-able) Arrow file."""
+    write_arrow(df, SNAPSHOT_PATH)
+
+    # Meta last: a snapshot is only trusted once its version is recorded.
+    write_json({"version": version, "source": source, "created_at": time.time()}, SNAPSHOT_META_PATH)
+
+
+def table_to_frame(table):
+    # Keep keywords as an Arrow list column (zero-copy from the memory map)
+    # instead of materializing a numpy array per row.
+    return table.to_pandas(types_mapper={KEYWORD_TYPE: KEYWORD_DTYPE}.get)
+
+
+def write_arrow(df, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    feather.write_feather(
+        pa.Table.from_pandas(df, preserve_index=False), tmp, compression="uncompressed"
+    )
+    os.replace(tmp, path)
+
+
+def write_json(obj, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(obj, f)
+    os.replace(path + ".tmp", path)
+
+
+# ==========================================
+# Delta Sync of a Partitioned Corpus
+# ==========================================
+
+def _part_path(name):
+    return os.path.join(PARTS_DIR, f"{name}.arrow")
+
+
+def read_local_parts(source):
+    """Local partition state: {"source", "manifest_version", "manifest", "versions"}."""
+    if os.path.exists(PARTS_META_PATH):
+        with open(PARTS_META_PATH, encoding="utf-8") as f:
+            local = json.load(f)
+        if local.get("source") == source:
+            return local
+    return {"source": source, "manifest_version": None, "manifest": None, "versions": {}}
+
+
+def load_local_parts(local):
+    tables = [
+        feather.read_table(_part_path(name), memory_map=True)
+        for name in sorted(local["versions"])
+        if os.path.exists(_part_path(name))
+    ]
+    if not tables:
+        return None
+    # Concatenating memory-mapped tables only stitches chunks together; no copy.
+    return table_to_frame(pa.concat_tables(tables, promote_options="default"))
+
+
+def sync_partitions(storage, manifest_path=MANIFEST_PATH):
+    """Download only new or changed partitions, then load all of them from disk.
+
+    Returns None when the backend has no partitioned corpus.
+    """
+    source = f"{storage.name}/{manifest_path}"
+    local = read_local_parts(source)
+
+    try:
+        manifest_version = storage.version(manifest_path)
+        if manifest_version is None:
+            return None
+
+        if manifest_version == local["manifest_version"]:
+            manifest = local["manifest"]
+        else:
+            manifest = json.loads(storage.download(manifest_path))
+
+        fetched = 0
+        for part in manifest["partitions"]:
+            name = part["name"]
+            if local["versions"].get(name) == part["version"] and os.path.exists(_part_path(name)):
+                continue
+
+            df = clean_fraud_data(pd.read_csv(io.BytesIO(storage.download(part["path"]))))
+            write_arrow(df, _part_path(name))
+            local["versions"][name] = part["version"]
+            fetched += 1
+
+        current = {part["name"] for part in manifest["partitions"]}
+        for name in list(local["versions"]):
+            if name not in current:
+                del local["versions"][name]
+                if os.path.exists(_part_path(name)):
+                    os.remove(_part_path(name))
+
+        local["manifest_version"] = manifest_version
+        local["manifest"] = manifest
+        write_json(local, PARTS_META_PATH)
+
+        if fetched:
+            print(f"[+] Synced {fetched} of {len(manifest['partitions'])} corpus partitions")
+
+    except Exception as e:
+        print(f"[!] Could not sync corpus partitions from {storage.name}: {e}")
+        if not local["versions"]:
+            # Nothing partitioned on disk either: let the caller try the single-CSV snapshot.
+            return None
+
+    return load_local_parts(local)
+
+
+def corpus_version(storage=None, path=SUPABASE_CSV_PATH):
+    """Cheap token that changes whenever the published corpus changes."""
+    if storage is None:
+        storage = get_storage()
+    return storage.version(MANIFEST_PATH) or storage.version(path)
+
+
+def load_fraud_data(storage=None, path=SUPABASE_CSV_PATH):
+    """Loads FINRA fraud CSV stored in Supabase bucket.
+
+    `storage` defaults to the process-wide backend (storage_backend.get_storage),
+    so a LocalStorage can stand in for Supabase offline. If the bucket holds a
+    partitioned corpus (MANIFEST_PATH) only new or changed partitions are
+    downloaded; otherwise the single CSV at `path` is used. Either way the
+    cleaned table is cached locally until the remote version changes.
+    """
+    if storage is None:
+        storage = get_storage()
+
+    # A published, partitioned corpus only costs the partitions that changed.
+    df = sync_partitions(storage)
+    if df is not None:
+        return df
+
+    source = f"{storage.name}/{path}"
+
+    try:
+        version = storage.version(path)
+    except Exception as e:
+        print(f"[!] Could not check {storage.name} for updates: {e}")
+        cached = read_snapshot(source, None)
+        if cached is not None:
+            return cached
+        raise
+
+    if version is not None:
+        cached = read_snapshot(source, version)
+        if cached is not None:
+            return cached
+
+    df = clean_fraud_data(pd.read_csv(io.BytesIO(storage.download(path))))
+
+    if version is not None:
+        write_snapshot(df, source, version)
+
+    return df
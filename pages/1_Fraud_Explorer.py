@@ -1,7 +1,8 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from intellifraud_ui import inject_light_ui
-from load_data_supabase import load_fraud_data
+from dataset import get_snapshot
 
 # ------------------------------------------------------------
 # PAGE CONFIG
@@ -76,14 +77,10 @@ ul[role="listbox"] li:hover {
 """, unsafe_allow_html=True)
 
 # ------------------------------------------------------------
-# LOAD DATA FROM SUPABASE
+# LOAD DATA (shared, process-wide)
 # ------------------------------------------------------------
-@st.cache_data
-def load_data():
-    df = load_fraud_data()
-    return df
-
-df = load_data()
+snapshot = get_snapshot()
+df = snapshot.articles_view()
 
 # ------------------------------------------------------------
 # FRAUD CATEGORIES
@@ -132,17 +129,15 @@ def match_score(article_keywords, category_keywords):
 
 def get_articles(category_name):
     cat_keywords = FRAUD_CATEGORIES[category_name]
-    results = []
-
-    for _, row in df.iterrows():
-        keywords_list = row["keywords"] if isinstance(row["keywords"], list) else []
-        score = match_score(keywords_list, cat_keywords)
+    keywords = snapshot.keywords
 
-        if score > 0:
-            results.append((score, row))
+    # Score each distinct keyword once, then sum per article over the CSR ids.
+    keyword_scores = [match_score([kw], cat_keywords) for kw in keywords.vocabulary]
+    scores = keywords.row_sums(keyword_scores)
 
-    results.sort(key=lambda x: x[0], reverse=True)
-    return [row for score, row in results]
+    order = np.argsort(-scores, kind="stable")
+    order = order[scores[order] > 0]
+    return df.iloc[order].to_dict("records")
 
 # ------------------------------------------------------------
 # HEADER
@@ -189,7 +184,7 @@ else:
         title = row["title"]
         summary = row["summary"]
         url = row["url"]
-        keywords = ", ".join(row["keywords"]) if isinstance(row["keywords"], list) else ""
+        keywords = row["keywords_text"]
 
         st.markdown(f"""
         <div style="
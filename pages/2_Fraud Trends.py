@@ -6,7 +6,7 @@ from pyvis.network import Network
 import streamlit.components.v1 as components
 
 from intellifraud_ui import inject_light_ui, sidebar_logo
-from load_data_supabase import load_fraud_data
+from dataset import get_snapshot
 
 # ---------------------------------------------
 # PAGE CONFIG & UI
@@ -46,31 +46,19 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ---------------------------------------------
-# LOAD DATA
+# LOAD DATA (shared, process-wide)
 # ---------------------------------------------
-@st.cache_data
-def load_data():
-    df = load_fraud_data()
-    df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
-
-    def ensure_list(val):
-        if isinstance(val, list):
-            return val
-        try:
-            return eval(val)
-        except:
-            return []
-    df["keywords"] = df["keywords"].apply(ensure_list)
-    return df
-
-df = load_data()
+snapshot = get_snapshot()
+keywords = snapshot.keywords
 
 # ---------------------------------------------
 # KEYWORD PROCESSING
 # ---------------------------------------------
-all_keywords = [kw for lst in df["keywords"] for kw in lst]
-keyword_freq = pd.Series(all_keywords).value_counts().reset_index()
-keyword_freq.columns = ["keyword", "count"]
+keyword_freq = (
+    pd.DataFrame({"keyword": keywords.vocabulary, "count": keywords.frequencies()})
+    .sort_values("count", ascending=False, kind="stable")
+    .reset_index(drop=True)
+)
 
 # =====================================================
 # SECTION 0 — TOP KEYWORDS
@@ -119,7 +107,7 @@ st.altair_chart(bar_chart, use_container_width=True)
 st.subheader("🕸️ Interactive Keyword Network")
 
 pairs = []
-for kw_list in df["keywords"]:
+for kw_list in keywords.rows():
     if len(kw_list) > 1:
         pairs.extend(itertools.combinations(kw_list, 2))
 
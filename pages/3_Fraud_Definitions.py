@@ -4,8 +4,8 @@ import pandas as pd
 # Theme UI (no sidebar logo)
 from intellifraud_ui import inject_light_ui
 
-# Supabase loader
-from load_data_supabase import load_fraud_data
+# Shared article snapshot
+from dataset import get_snapshot
 
 # Import your full dictionary of keyword definitions
 from definitions import TERM_DEFINITIONS
@@ -41,17 +41,9 @@ st.markdown("""
 
 
 # ---------------------------------------------
-# LOAD SUPABASE DATA
+# LOAD DATA (shared, process-wide)
 # ---------------------------------------------
-@st.cache_data
-def load_data():
-    df = load_fraud_data()
-    df["keywords"] = df["keywords"].apply(lambda x: x if isinstance(x, list) else [])
-    return df
-
-df = load_data()
-
-all_keywords = sorted({kw.lower() for kw_list in df["keywords"] for kw in kw_list})
+all_keywords = sorted(get_snapshot().keywords.vocabulary)
 
 
 # ---------------------------------------------
@@ -0,0 +1,78 @@
+# publish_corpus.py
+"""Publish the enriched corpus to storage as month partitions plus a manifest.
+
+    python publish_corpus.py fraud_analysis_final.csv
+
+Rows are partitioned by the month of their `timestamp` (when they were added to
+the corpus), so new articles only touch the current month's file. Partitions
+whose content is unchanged are not re-uploaded, and the manifest goes up last
+so readers never see a partition list that points at missing files.
+"""
+import argparse
+import hashlib
+import json
+import posixpath
+import time
+
+import pandas as pd
+
+from load_data_supabase import MANIFEST_PATH
+from storage_backend import get_storage, LocalStorage
+
+UNDATED_PARTITION = "undated"
+
+
+def partition_by_month(df):
+    """{"YYYY-MM": rows} keyed by the month of each row's timestamp."""
+    months = pd.to_datetime(df["timestamp"], errors="coerce").dt.strftime("%Y-%m")
+    months = months.fillna(UNDATED_PARTITION)
+    return {name: part for name, part in df.groupby(months, sort=True)}
+
+
+def remote_manifest(storage, manifest_path=MANIFEST_PATH):
+    if storage.version(manifest_path) is None:
+        return {"partitions": []}
+    return json.loads(storage.download(manifest_path))
+
+
+def publish_partitions(df, storage, manifest_path=MANIFEST_PATH):
+    """Upload changed month partitions of df and rewrite the manifest."""
+    folder = posixpath.dirname(manifest_path)
+    previous = {p["name"]: p for p in remote_manifest(storage, manifest_path)["partitions"]}
+    partitions = []
+    uploaded = 0
+
+    for name, part in partition_by_month(df).items():
+        data = part.to_csv(index=False).encode("utf-8")
+        version = hashlib.sha256(data).hexdigest()
+        path = posixpath.join(folder, f"{name}.csv")
+
+        if previous.get(name, {}).get("version") != version:
+            storage.upload(path, data, content_type="text/csv")
+            uploaded += 1
+
+        partitions.append({"name": name, "path": path, "version": version, "rows": len(part)})
+
+    manifest = {"partitions": partitions, "updated_at": time.time()}
+    storage.upload(
+        manifest_path, json.dumps(manifest, indent=2).encode("utf-8"),
+        content_type="application/json",
+    )
+
+    print(f"[✓] Published {len(partitions)} partitions ({uploaded} uploaded) to {storage.name}")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Publish the enriched corpus as month partitions.")
+    parser.add_argument("csv", nargs="?", default="fraud_analysis_final.csv")
+    parser.add_argument("--local", metavar="DIR",
+                        help="publish to a local directory instead of the configured storage")
+    args = parser.parse_args(argv)
+
+    storage = LocalStorage(args.local) if args.local else get_storage()
+    publish_partitions(pd.read_csv(args.csv), storage)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# quantization.py
+"""Int8 scalar quantization of embeddings and dot products on the codes.
+
+Each vector v is stored as int8 codes c = round(v / s) with its own scale
+s = max|v| / 127, a quarter of float32 and half of float16. The query is
+quantized the same way, c_v · c_q is accumulated in int32 straight from the
+int8 matrix, and s_v * s_q turns it back into a cosine.
+"""
+import numpy as np
+
+SCORE_BLOCK = 8192   # rows converted to float32 per block when scoring float vectors
+
+
+def quantize_int8(vectors):
+    """(codes, scales): int8 codes and per-row float32 scales of a 2-d array."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def quantize_query(query_vec):
+    codes, scales = quantize_int8(np.asarray(query_vec)[None, :])
+    return codes[0], float(scales[0])
+
+
+def dot_scores(vectors, query_vec, scales=None):
+    """vectors @ query_vec as float32; int8 vectors need their per-row scales."""
+    if scales is not None:
+        query_codes, query_scale = quantize_query(query_vec)
+        dots = np.einsum("ij,j->i", vectors, query_codes, dtype=np.int32)
+        return dots * (np.asarray(scales, dtype=np.float32) * np.float32(query_scale))
+
+    query_vec = np.asarray(query_vec, dtype=np.float32)
+    # float16 has no BLAS path: score float32 blocks instead.
+    return np.concatenate([
+        np.asarray(vectors[start:start + SCORE_BLOCK], dtype=np.float32) @ query_vec
+        for start in range(0, len(vectors), SCORE_BLOCK)
+    ] or [np.empty(0, dtype=np.float32)])
@@ -0,0 +1,154 @@
+# search_index.py
+"""TF-IDF search index, persisted next to the corpus snapshot.
+
+Fitting the vectorizer costs a full pass over the corpus, so the fitted
+vocabulary, IDF weights and document matrix are saved under INDEX_DIR in a
+directory named after the corpus fingerprint. A new process with the same
+corpus memory-maps the saved arrays instead of refitting.
+"""
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+import sklearn
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from load_data_supabase import SNAPSHOT_DIR, write_json
+
+INDEX_DIR = os.path.join(SNAPSHOT_DIR, "index")
+
+# Bump when the artifact layout or the vectorizer settings change.
+TFIDF_FORMAT = 1
+TFIDF_PARAMS = {"stop_words": "english"}
+
+MATRIX_ARRAYS = ["data", "indices", "indptr"]
+
+
+def top_k(scores, k):
+    """Indices of the k highest scores, best first, without sorting all of them."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        candidates = np.argpartition(scores, len(scores) - k)[-k:]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class TfidfIndex:
+    """Fitted vectorizer plus its L2-normalized document matrix.
+
+    Rows and query vectors are unit length, so cosine similarity is a plain
+    sparse dot product.
+    """
+
+    def __init__(self, vectorizer, matrix):
+        self.vectorizer = vectorizer
+        self.matrix = matrix
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def scores(self, query):
+        """Cosine similarity of query against every document."""
+        query_vec = self.vectorizer.transform([query.lower()])
+        return self.matrix @ query_vec.toarray().ravel()
+
+    def search(self, query, k=10):
+        """The k best documents for query as ranked (index, score) pairs."""
+        scores = self.scores(query)
+        return [(int(i), float(scores[i])) for i in top_k(scores, k)]
+
+
+def corpus_fingerprint(df):
+    """Content hash of the searchable text (row order included)."""
+    digest = hashlib.sha256()
+    digest.update(pd.util.hash_pandas_object(df["search_text"], index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _index_key(fingerprint):
+    key = json.dumps([TFIDF_FORMAT, TFIDF_PARAMS, sklearn.__version__, fingerprint])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def _index_path(key):
+    return os.path.join(INDEX_DIR, f"tfidf-{key}")
+
+
+def load_tfidf(key):
+    """TfidfIndex from the saved artifact, or None if there is none."""
+    path = _index_path(key)
+    meta_path = os.path.join(path, "meta.json")
+    if not os.path.exists(meta_path):
+        return None
+
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    with open(os.path.join(path, "vocabulary.json"), encoding="utf-8") as f:
+        terms = json.load(f)
+
+    vectorizer = TfidfVectorizer(**TFIDF_PARAMS)
+    vectorizer.vocabulary_ = {term: i for i, term in enumerate(terms)}
+    vectorizer.idf_ = np.load(os.path.join(path, "idf.npy"))
+
+    arrays = [np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in MATRIX_ARRAYS]
+    matrix = sp.csr_matrix(tuple(arrays), shape=tuple(meta["shape"]))
+    return TfidfIndex(vectorizer, matrix)
+
+
+def save_tfidf(key, fingerprint, index):
+    vectorizer, matrix = index.vectorizer, index.matrix
+    path = _index_path(key)
+    tmp = path + ".tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+
+    terms = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+    with open(os.path.join(tmp, "vocabulary.json"), "w", encoding="utf-8") as f:
+        json.dump(terms, f)
+    np.save(os.path.join(tmp, "idf.npy"), vectorizer.idf_)
+
+    matrix = matrix.tocsr()
+    for name in MATRIX_ARRAYS:
+        np.save(os.path.join(tmp, f"{name}.npy"), getattr(matrix, name))
+
+    # Meta last: an artifact is only trusted once it is complete.
+    meta = {"format": TFIDF_FORMAT, "fingerprint": fingerprint, "shape": list(matrix.shape)}
+    write_json(meta, os.path.join(tmp, "meta.json"))
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp, path)
+
+    # Only the current corpus's index is ever loaded; drop the rest.
+    for name in os.listdir(INDEX_DIR):
+        if name.startswith("tfidf-") and os.path.join(INDEX_DIR, name) != path:
+            shutil.rmtree(os.path.join(INDEX_DIR, name), ignore_errors=True)
+
+
+def build_tfidf(df):
+    """Home-page TF-IDF model over df["search_text"], loaded from disk when possible."""
+    fingerprint = corpus_fingerprint(df)
+    key = _index_key(fingerprint)
+
+    try:
+        cached = load_tfidf(key)
+        if cached is not None:
+            return cached
+    except Exception as e:
+        print(f"[!] Could not load TF-IDF index {key}, refitting: {e}")
+
+    vectorizer = TfidfVectorizer(**TFIDF_PARAMS)
+    index = TfidfIndex(vectorizer, vectorizer.fit_transform(df["search_text"]).tocsr())
+
+    try:
+        save_tfidf(key, fingerprint, index)
+    except OSError as e:
+        print(f"[!] Could not save TF-IDF index {key}: {e}")
+
+    return index
@@ -0,0 +1,107 @@
+# storage_backend.py
+import os
+import posixpath
+import threading
+
+from supabase_client import get_supabase, SUPABASE_BUCKET
+
+# "supabase" (default) or "local:<directory>"
+STORAGE_ENV = "INTELLIFRAUD_STORAGE"
+
+
+class StorageBackend:
+    """Minimal object store the data loader reads the corpus from."""
+
+    name = "storage"
+
+    def download(self, path):
+        """Return the object's bytes."""
+        raise NotImplementedError
+
+    def version(self, path):
+        """Cheap token that changes whenever the object changes (None if unknown)."""
+        raise NotImplementedError
+
+    def upload(self, path, data, content_type="application/octet-stream"):
+        """Create or overwrite the object at path."""
+        raise NotImplementedError
+
+
+class SupabaseStorage(StorageBackend):
+    """Objects in a Supabase Storage bucket."""
+
+    def __init__(self, bucket=SUPABASE_BUCKET):
+        self.bucket_name = bucket
+        self.name = f"supabase:{bucket}"
+
+    @property
+    def bucket(self):
+        return get_supabase().storage.from_(self.bucket_name)
+
+    def download(self, path):
+        data = self.bucket.download(path)
+        if data is None:
+            raise ValueError(f"Failed to download {path} from Supabase.")
+        return data
+
+    def version(self, path):
+        folder, name = posixpath.split(path)
+        for f in self.bucket.list(folder, {"search": name}) or []:
+            if f.get("name") == name:
+                metadata = f.get("metadata") or {}
+                return metadata.get("eTag") or f.get("updated_at")
+        return None
+
+    def upload(self, path, data, content_type="application/octet-stream"):
+        self.bucket.upload(path, data, {"content-type": content_type, "x-upsert": "true"})
+
+
+class LocalStorage(StorageBackend):
+    """Objects as files under a local directory — for offline runs, tests and benchmarks."""
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.name = f"local:{self.root}"
+
+    def _path(self, path):
+        return os.path.join(self.root, *path.split("/"))
+
+    def download(self, path):
+        with open(self._path(path), "rb") as f:
+            return f.read()
+
+    def version(self, path):
+        try:
+            st = os.stat(self._path(path))
+        except FileNotFoundError:
+            return None
+        return f"{st.st_mtime_ns}-{st.st_size}"
+
+    def upload(self, path, data, content_type="application/octet-stream"):
+        target = self._path(path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(target + ".tmp", target)
+
+
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def get_storage():
+    """Process-wide backend selected by $INTELLIFRAUD_STORAGE."""
+    global _storage
+
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                setting = os.getenv(STORAGE_ENV, "supabase")
+                if setting.startswith("local:"):
+                    _storage = LocalStorage(setting[len("local:"):])
+                elif setting == "supabase":
+                    _storage = SupabaseStorage()
+                else:
+                    raise ValueError(f"Unknown {STORAGE_ENV} setting: {setting!r}")
+
+    return _storage
@@ -1,6 +1,7 @@
 # supabase_client.py
 import os
-from supabase import create_client
+import threading
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -8,13 +9,30 @@ load_dotenv()
 SUPABASE_BUCKET = "DTSC_project"
 SUPABASE_CSV_PATH = "csv/articles-fraud.csv"  # exact path from your working file
 
+_client = None
+_client_lock = threading.Lock()
+
+
 def get_supabase():
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_KEY")
+    """Shared Supabase client, created on first use.
+
+    Importing this module no longer needs credentials or the network. The one
+    client (and the pooled HTTP connections inside it) is reused by every
+    caller and survives Streamlit reruns, since modules are imported once.
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from supabase import create_client
+
+                url = os.getenv("SUPABASE_URL")
+                key = os.getenv("SUPABASE_KEY")
 
-    if not url or not key:
-        raise RuntimeError("Missing Supabase credentials.")
+                if not url or not key:
+                    raise RuntimeError("Missing Supabase credentials.")
 
-    return create_client(url, key)
+                _client = create_client(url, key)
 
-supabase = get_supabase()
+    return _client
@@ -0,0 +1,56 @@
+# conftest.py
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+# The project is a set of top-level modules run from the repo root.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Read when load_data_supabase is imported: keep every snapshot out of the repo.
+CACHE_DIR = os.environ["INTELLIFRAUD_CACHE_DIR"] = tempfile.mkdtemp(prefix="intellifraud-cache-")
+
+from fixture_site import FixtureSite  # noqa: E402
+from storage_backend import LocalStorage  # noqa: E402
+
+
+class RecordingStorage(LocalStorage):
+    """LocalStorage that records every download."""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.downloads = []
+
+    def download(self, path):
+        self.downloads.append(path)
+        return super().download(path)
+
+
+@pytest.fixture
+def cache_dir():
+    """The (emptied) local snapshot directory of load_data_supabase."""
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    yield CACHE_DIR
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+
+@pytest.fixture
+def storage(tmp_path, cache_dir):
+    return RecordingStorage(tmp_path / "bucket")
+
+
+@pytest.fixture
+def site():
+    with FixtureSite(articles=8) as site:
+        yield site
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in an empty directory: the scraper writes its log, CSV, state and cache to the cwd."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
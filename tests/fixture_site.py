@@ -0,0 +1,101 @@
+# fixture_site.py
+"""A tiny local stand-in for finra.org that the crawler can be run against.
+
+One paginated index (PAGE_SIZE links per page, rel="next" between pages) and
+one fraud-related article per id. Articles send an ETag and answer a matching
+If-None-Match with 304. Extra raw pages (e.g. a body that is not valid UTF-8)
+can be served at any path through `FixtureSite.raw`.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+INDEX_PATH = "/media-center/news-releases"
+PAGE_SIZE = 3
+
+
+def article_html(i):
+    return (
+        f"<html><body><h1>Article {i}</h1>"
+        f'<time datetime="2024-01-{i % 28 + 1:02d}">Jan</time>'
+        f"<p>Broker {i} ran a securities fraud scheme against investors in city {i}.</p>"
+        f"<p>Regulators fined firm number {i} for misleading statements about account {i}.</p>"
+        f"</body></html>"
+    )
+
+
+class FixtureSite:
+    """Serve `articles` article pages over HTTP on a free localhost port."""
+
+    def __init__(self, articles=8):
+        self.articles = articles
+        self.raw = {}          # path -> (content type, body bytes)
+        self.extra_links = []  # paths listed on the first index page besides the articles
+        self.requests = []     # (path, status) of every request served
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                status, content_type, body, headers = site.respond(self)
+                site.requests.append((self.path, status))
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    @property
+    def index_url(self):
+        return self.url + INDEX_PATH
+
+    def article_url(self, i):
+        return f"{self.index_url}/article-{i}"
+
+    def respond(self, request):
+        parsed = urlparse(request.path)
+        html = "text/html; charset=utf-8"
+
+        if parsed.path in self.raw:
+            content_type, body = self.raw[parsed.path]
+            return 200, content_type, body, {}
+
+        if parsed.path == INDEX_PATH:
+            page = int(parse_qs(parsed.query).get("page", ["0"])[0])
+            ids = range(page * PAGE_SIZE, min((page + 1) * PAGE_SIZE, self.articles))
+            links = [f"{INDEX_PATH}/article-{i}" for i in ids]
+            if page == 0:
+                links += self.extra_links
+            body = "".join(f'<a href="{link}">{link}</a>' for link in links)
+            if (page + 1) * PAGE_SIZE < self.articles:
+                body += f'<a rel="next" href="?page={page + 1}">Next</a>'
+            return 200, html, f"<html><body>{body}</body></html>".encode(), {}
+
+        prefix = INDEX_PATH + "/article-"
+        if parsed.path.startswith(prefix):
+            i = int(parsed.path[len(prefix):])
+            etag = f'"a{i}"'
+            if request.headers.get("If-None-Match") == etag:
+                return 304, html, b"", {"ETag": etag}
+            return 200, html, article_html(i).encode(), {"ETag": etag}
+
+        return 404, html, b"not found", {}
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
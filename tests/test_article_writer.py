@@ -0,0 +1,49 @@
+# test_article_writer.py
+import json
+
+from article_writer import ArticleWriter, read_articles
+
+
+def article(i, content=None):
+    return {
+        "title": f"Article {i}",
+        "url": f"https://example.org/media-center/{i}",
+        "article_date": "2024-01-01",
+        "content": content or f"body of article number {i} about a fraud scheme",
+        "keyword_hits": {"fraud": [0]},
+    }
+
+
+def test_resume_truncates_rows_after_last_checkpoint(tmp_path):
+    path = str(tmp_path / "log.jsonl")
+    committed = []
+
+    writer = ArticleWriter(path, checkpoint_every=2, on_checkpoint=lambda: committed.append(True))
+    for i in range(3):
+        writer.write(article(i))
+    # Crash: the third row reached the file but no checkpoint covers it.
+    writer.file.close()
+
+    assert len(committed) == 1
+    with open(path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 3
+
+    writer = ArticleWriter(path, checkpoint_every=2)
+    assert writer.rows == 2
+    writer.write(article(3))
+    writer.close()
+
+    assert read_articles(path)["title"].tolist() == ["Article 0", "Article 1", "Article 3"]
+
+
+def test_no_resume_starts_a_fresh_log(tmp_path):
+    path = str(tmp_path / "log.jsonl")
+    with ArticleWriter(path) as writer:
+        writer.write(article(0))
+
+    with ArticleWriter(path, resume=False) as writer:
+        writer.write(article(1))
+
+    assert read_articles(path)["title"].tolist() == ["Article 1"]
+    with open(path + ".checkpoint", encoding="utf-8") as f:
+        assert json.load(f)["rows"] == 1
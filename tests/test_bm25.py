@@ -0,0 +1,32 @@
+# test_bm25.py
+import numpy as np
+
+from benchmarks.search_benchmark import VOCABULARY, synthetic_counts
+from bm25_index import Bm25Index
+
+
+def exhaustive_top_k(index, query, k):
+    scores = index.scores(query)
+    order = np.argsort(-scores, kind="stable")[:k]
+    return [(int(doc), float(scores[doc])) for doc in order if scores[doc] > 0]
+
+
+def test_maxscore_search_matches_exhaustive_scoring():
+    index = Bm25Index(str.split, {f"t{i}": i for i in range(VOCABULARY)}, synthetic_counts(2000))
+    rng = np.random.default_rng(0)
+
+    for _ in range(100):
+        query = " ".join(f"t{t}" for t in (rng.zipf(1.3, rng.integers(1, 5)) - 1) % VOCABULARY)
+        k = int(rng.integers(1, 20))
+        expected = exhaustive_top_k(index, query, k)
+        actual = index.search(query, k)
+
+        np.testing.assert_allclose([s for _, s in actual], [s for _, s in expected], rtol=1e-5)
+        # Documents tied with the k-th score may be picked either way.
+        cutoff = expected[-1][1] * (1 + 1e-5) if expected else 0.0
+        assert {d for d, s in actual if s > cutoff} == {d for d, s in expected if s > cutoff}
+
+
+def test_unknown_terms_find_nothing():
+    index = Bm25Index(str.split, {"t0": 0}, synthetic_counts(10)[:, :1])
+    assert index.search("nothing here", 5) == []
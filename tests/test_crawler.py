@@ -0,0 +1,64 @@
+# test_crawler.py
+"""End-to-end crawls of the local fixture site (tests/fixture_site.py)."""
+import pandas as pd
+import pytest
+
+import intellifraud_scraper as scraper
+from fixture_site import INDEX_PATH, FixtureSite, article_html
+
+
+def crawl(site, *args):
+    scraper.main(["--sources", site.index_url, "--rate", "0", "--parse-workers", "1", *args])
+    return pd.read_csv("fraud_articles.csv")
+
+
+def article_statuses(site):
+    return [status for path, status in site.requests if "/article-" in path]
+
+
+@pytest.mark.parametrize("mode", [[], ["--async"]])
+def test_crawl_follows_pagination(site, workdir, mode):
+    df = crawl(site, *mode)
+
+    assert sorted(df["url"]) == sorted(site.article_url(i) for i in range(site.articles))
+    assert sum(path.startswith(INDEX_PATH + "?page=") for path, _ in site.requests) == 2
+    assert df["keyword_hits"].str.contains("securities fraud").all()
+
+
+def test_recrawl_sends_conditional_requests(site, workdir):
+    crawl(site)
+    site.requests.clear()
+
+    df = crawl(site)
+
+    # Every link on the first index page is known, so discovery stops there
+    # and each of its articles comes back 304 Not Modified.
+    assert article_statuses(site) == [304] * 3
+    assert len(df) == site.articles
+
+
+def test_async_crawl_survives_undecodable_page(site, workdir):
+    body = article_html(99).encode().replace(b"Broker", b"Br\xff\xfeoker")
+    site.raw["/media-center/bad"] = ("text/html; charset=utf-8", body)
+    site.extra_links.append("/media-center/bad")
+
+    df = crawl(site, "--async")
+
+    assert len(df) == site.articles + 1
+    assert (site.url + "/media-center/bad") in set(df["url"])
+
+
+def test_reparse_rebuilds_from_cache_offline(workdir):
+    with FixtureSite(articles=5) as site:
+        crawl(site)
+    # The server is gone: only the HTML cache is left.
+    df = crawl(site, "--reparse")
+
+    assert len(df) == 5
+
+
+def test_reparse_keeps_articles_without_cached_html(site, workdir):
+    crawl(site, "--no-cache")
+
+    assert len(crawl(site, "--reparse")) == site.articles
+    assert len(crawl(site)) == site.articles
@@ -0,0 +1,63 @@
+# test_dedup.py
+from article_writer import ArticleWriter, read_articles
+from dedup import NearDuplicateIndex
+
+BODY = (
+    "FINRA fined the broker-dealer for a securities fraud scheme in which "
+    "registered representatives sold unsuitable products to elderly customers "
+    "and made misleading statements about the risks of the investments."
+)
+
+
+def test_near_duplicates_share_a_canonical_key():
+    index = NearDuplicateIndex()
+    assert index.add("a", BODY) == "a"
+    assert index.add("b", BODY + " Published by FINRA.") == "a"
+    assert index.add("c", "A completely different article about an unrelated enforcement action "
+                          "against a crypto asset platform for failing to supervise traders.") == "c"
+
+
+def test_refetched_page_is_not_its_own_duplicate():
+    index = NearDuplicateIndex()
+    index.add("a", BODY)
+    assert index.add("a", BODY) == "a"
+    assert len(index) == 1
+
+
+def test_bodies_too_short_to_sign_are_never_aliased():
+    index = NearDuplicateIndex()
+    assert index.add("e", "") == "e"
+    assert index.add("f", "") == "f"
+    assert index.add("g", "fraud alert") == "g"
+    assert index.add("h", "fraud alert") == "h"
+    assert len(index) == 0
+
+
+OTHER = (
+    "The regulator expelled a firm whose brokers churned retirement accounts, "
+    "generating excessive commissions while concealing the losses from clients "
+    "through falsified monthly account statements and forged signatures."
+)
+
+
+def article(url, content):
+    return {"title": url, "url": url, "article_date": "2024-01-01", "content": content,
+            "keyword_hits": {}}
+
+
+def test_recrawled_canonical_that_became_a_duplicate(tmp_path):
+    path = str(tmp_path / "log.jsonl")
+    index = NearDuplicateIndex()
+
+    with ArticleWriter(path, dedup=index) as writer:
+        writer.write(article("A", BODY))
+        writer.write(article("B", OTHER))
+        writer.write(article("X", OTHER + " Published by FINRA."))
+        writer.write(article("B", BODY))   # recrawl: B now carries A's body
+
+    # B's old body no longer pulls new documents onto A.
+    assert index.add("Y", OTHER + " Reported by FINRA.") == "Y"
+
+    df = read_articles(path)
+    assert df["url"].tolist() == ["A"]
+    assert sorted(df.loc[0, "aliases"]) == ["B", "X"]
@@ -0,0 +1,100 @@
+# test_delta_sync.py
+"""Month-partitioned corpus: publish_corpus.py -> load_fraud_data delta sync."""
+import os
+
+import pandas as pd
+import pytest
+
+from load_data_supabase import MANIFEST_PATH, PARTS_DIR, load_fraud_data
+from publish_corpus import publish_partitions
+from storage_backend import LocalStorage
+
+
+def corpus(months):
+    """Two articles per month in months ("2024-01", ...)."""
+    rows = [
+        {
+            "title": f"Article {month}-{i}",
+            "url": f"https://example.org/{month}/{i}",
+            "summary": f"Fraud case {i} of {month}.",
+            "keywords": "fraud, scheme",
+            "timestamp": f"{month}-1{i}",
+        }
+        for month in months for i in range(2)
+    ]
+    return pd.DataFrame(rows)
+
+
+def part_downloads(storage):
+    return sorted(path for path in storage.downloads if path != MANIFEST_PATH)
+
+
+def local_parts():
+    return sorted(name for name in os.listdir(PARTS_DIR) if name.endswith(".arrow"))
+
+
+def test_republish_downloads_only_the_changed_month(storage):
+    df = corpus(["2024-01", "2024-02", "2024-03"])
+    publish_partitions(df, storage)
+    assert len(load_fraud_data(storage)) == 6
+    assert len(part_downloads(storage)) == 3
+
+    changed = pd.concat([df, corpus(["2024-02"]).assign(url=lambda d: d["url"] + "-new")])
+    publish_partitions(changed, storage)
+    storage.downloads.clear()
+
+    merged = load_fraud_data(storage)
+
+    assert part_downloads(storage) == ["csv/articles-fraud/2024-02.csv"]
+    assert len(merged) == 8
+    assert merged["url"].is_unique
+
+
+def test_unchanged_manifest_downloads_nothing(storage):
+    publish_partitions(corpus(["2024-01", "2024-02"]), storage)
+    load_fraud_data(storage)
+    storage.downloads.clear()
+
+    assert len(load_fraud_data(storage)) == 4
+    assert storage.downloads == []
+
+
+def test_removed_partition_disappears_locally(storage):
+    publish_partitions(corpus(["2024-01", "2024-02", "2024-03"]), storage)
+    load_fraud_data(storage)
+    assert local_parts() == ["2024-01.arrow", "2024-02.arrow", "2024-03.arrow"]
+
+    publish_partitions(corpus(["2024-01", "2024-03"]), storage)
+    df = load_fraud_data(storage)
+
+    assert local_parts() == ["2024-01.arrow", "2024-03.arrow"]
+    assert sorted(df["timestamp"].str[:7].unique()) == ["2024-01", "2024-03"]
+
+
+class Unreachable(LocalStorage):
+    """The same bucket with the network down."""
+
+    def version(self, path):
+        raise ConnectionError("offline")
+
+    def download(self, path):
+        raise ConnectionError("offline")
+
+
+def test_unreachable_manifest_serves_local_partitions(storage):
+    publish_partitions(corpus(["2024-01", "2024-02"]), storage)
+    load_fraud_data(storage)
+
+    assert len(load_fraud_data(Unreachable(storage.root))) == 4
+
+
+def test_unreachable_backend_falls_back_to_the_csv_snapshot(storage):
+    # No partitions were ever synced: the single-CSV snapshot must still be used.
+    df = corpus(["2024-01"])
+    storage.upload("csv/articles-fraud.csv", df.to_csv(index=False).encode("utf-8"))
+    load_fraud_data(storage)
+
+    assert len(load_fraud_data(Unreachable(storage.root))) == 2
+
+    with pytest.raises(ConnectionError):
+        load_fraud_data(Unreachable(storage.root + "-elsewhere"))
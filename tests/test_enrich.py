@@ -0,0 +1,80 @@
+# test_enrich.py
+"""The incremental contract of enrich_articles.py, with spaCy replaced by a fake."""
+import pandas as pd
+import pytest
+
+import enrich_articles
+from enrich_articles import OUTPUT_COLUMNS
+
+
+@pytest.fixture
+def enriched(monkeypatch, workdir):
+    """Record the URLs each enrich() call processes; stamp rows with the run number."""
+    calls = []
+
+    def fake_enrich(articles, model=None, n_process=1, batch_size=None):
+        calls.append(sorted(articles["url"]))
+        return pd.DataFrame({
+            "title": articles["title"],
+            "url": articles["url"],
+            "summary": [f"run {len(calls)}: {content}" for content in articles["content"]],
+            "keywords": "fraud",
+            "timestamp": f"run {len(calls)}",
+            "content_hash": articles["content_hash"],
+        }, columns=OUTPUT_COLUMNS)
+
+    monkeypatch.setattr(enrich_articles, "enrich", fake_enrich)
+    return calls
+
+
+def write_articles(contents):
+    pd.DataFrame({
+        "title": [f"Article {url}" for url in contents],
+        "url": list(contents),
+        "article_date": "2024-01-01",
+        "content": list(contents.values()),
+    }).to_csv("fraud_articles.csv", index=False)
+
+
+def output():
+    return pd.read_csv("fraud_analysis_final.csv").set_index("url")
+
+
+def test_only_new_and_changed_articles_are_enriched(enriched):
+    write_articles({"a": "first body", "b": "second body", "c": "third body"})
+    enrich_articles.main([])
+    assert enriched == [["a", "b", "c"]]
+
+    # A row that came from elsewhere (not in fraud_articles.csv) must survive.
+    df = pd.read_csv("fraud_analysis_final.csv")
+    other = {"title": "Other", "url": "other", "summary": "kept", "keywords": "scam",
+             "timestamp": "elsewhere", "content_hash": "x"}
+    pd.concat([df, pd.DataFrame([other])]).to_csv("fraud_analysis_final.csv", index=False)
+
+    write_articles({"a": "first body", "b": "second body, edited", "c": "third body", "d": "new"})
+    enrich_articles.main([])
+
+    assert enriched[1] == ["b", "d"]
+    df = output()
+    assert sorted(df.index) == ["a", "b", "c", "d", "other"]
+    assert df.loc[["a", "c"], "timestamp"].tolist() == ["run 1", "run 1"]
+    assert df.loc["b", "summary"] == "run 2: second body, edited"
+    assert df.loc["d", "timestamp"] == "run 2"
+    assert df.loc["other", "summary"] == "kept"
+
+
+def test_up_to_date_output_is_left_alone(enriched):
+    write_articles({"a": "first body"})
+    enrich_articles.main([])
+    enrich_articles.main([])
+
+    assert len(enriched) == 1
+
+
+def test_force_re_enriches_everything(enriched):
+    write_articles({"a": "first body", "b": "second body"})
+    enrich_articles.main([])
+    enrich_articles.main(["--force"])
+
+    assert enriched == [["a", "b"], ["a", "b"]]
+    assert output()["timestamp"].tolist() == ["run 2", "run 2"]
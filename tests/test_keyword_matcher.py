@@ -0,0 +1,33 @@
+# test_keyword_matcher.py
+import random
+
+from keyword_matcher import KeywordMatcher
+
+KEYWORDS = ["fraud", "securities fraud", "scam", "scheme", "misleading"]
+
+
+def naive_match(keywords, text):
+    """Every start offset of every keyword, by repeated str.find."""
+    hits = {}
+    lowered = text.lower()
+    for keyword in keywords:
+        start = lowered.find(keyword)
+        while start != -1:
+            hits.setdefault(keyword, []).append(start)
+            start = lowered.find(keyword, start + 1)
+    return hits
+
+
+def test_keyword_offsets_include_overlapping_hits():
+    text = "Securities fraud and FRAUDSTERS"
+    assert KeywordMatcher(KEYWORDS).match(text) == {"securities fraud": [0], "fraud": [11, 21]}
+
+
+def test_keyword_offsets_match_naive_search():
+    rng = random.Random(0)
+    words = ["securities", "fraud", "scam", "scheme", "schemes", "misleading", "broker", "the"]
+    matcher = KeywordMatcher(KEYWORDS)
+    for _ in range(200):
+        text = " ".join(rng.choice(words) for _ in range(20)).upper()
+        assert matcher.match(text) == naive_match(KEYWORDS, text)
+        assert matcher.matches_any(text) == bool(naive_match(KEYWORDS, text))
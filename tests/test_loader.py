@@ -0,0 +1,55 @@
+# test_loader.py
+"""load_fraud_data against a LocalStorage bucket, with the local snapshot cache."""
+import io
+import os
+
+import pandas as pd
+
+from load_data_supabase import SNAPSHOT_PATH, load_fraud_data
+from supabase_client import SUPABASE_CSV_PATH
+
+RAW = pd.DataFrame({
+    "title": ["Ponzi case", "Phishing alert", "No keywords"],
+    "url": ["https://example.org/1", "https://example.org/2", "https://example.org/3"],
+    "summary": ["A ponzi scheme.", "Phishing emails.", None],
+    "keywords": ["Ponzi Scheme, fraud , ,FRAUD", "phishing,Identity Theft", None],
+    "timestamp": ["2024-01-05", "2024-02-10", "2024-02-11"],
+})
+
+
+def upload_csv(storage, df, path=SUPABASE_CSV_PATH):
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False)
+    storage.upload(path, buffer.getvalue().encode("utf-8"), content_type="text/csv")
+
+
+def test_load_normalizes_keywords(storage):
+    upload_csv(storage, RAW)
+
+    df = load_fraud_data(storage)
+
+    assert df["keywords"].tolist() == [["ponzi scheme", "fraud"], ["phishing", "identity theft"], []]
+    assert df["summary"].tolist()[:2] == ["A ponzi scheme.", "Phishing emails."]
+
+
+def test_second_load_reuses_the_snapshot(storage):
+    upload_csv(storage, RAW)
+    first = load_fraud_data(storage)
+
+    second = load_fraud_data(storage)
+
+    assert os.path.exists(SNAPSHOT_PATH)
+    assert storage.downloads == [SUPABASE_CSV_PATH]
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_changed_csv_is_downloaded_again(storage):
+    upload_csv(storage, RAW)
+    load_fraud_data(storage)
+
+    upload_csv(storage, RAW.iloc[:2])
+    df = load_fraud_data(storage)
+
+    assert storage.downloads == [SUPABASE_CSV_PATH, SUPABASE_CSV_PATH]
+    assert len(df) == 2
+